@@ -0,0 +1,609 @@
+"""
+Static DHCP option metadata table.
+
+Generated from runtime_assets/options.csv so importing the package loads a
+plain dict literal instead of parsing the CSV on every interpreter start.
+To regenerate after editing the CSV, rebuild this dict with the comprehension
+documented in the git history of dhcppython/options.py and dump it here.
+"""
+from typing import Dict, Union
+
+OPTIONS: Dict[int, Dict[str, Union[str, int]]] = {0: {'name': 'Pad', 'len': 0, 'description': 'None', 'rfc': '2132'},
+ 1: {'name': 'Subnet Mask',
+     'len': 4,
+     'description': 'Subnet Mask Value',
+     'rfc': '2132'},
+ 2: {'name': 'Time Offset',
+     'len': 4,
+     'description': 'Time Offset in Seconds from UTC                   \n'
+                    '(note: deprecated by 100 and 101)',
+     'rfc': '2132'},
+ 3: {'name': 'Router',
+     'len': 'N',
+     'description': 'N/4 Router addresses',
+     'rfc': '2132'},
+ 4: {'name': 'Time Server',
+     'len': 'N',
+     'description': 'N/4 Timeserver addresses',
+     'rfc': '2132'},
+ 5: {'name': 'Name Server',
+     'len': 'N',
+     'description': 'N/4 IEN-116 Server addresses',
+     'rfc': '2132'},
+ 6: {'name': 'Domain Server',
+     'len': 'N',
+     'description': 'N/4 DNS Server addresses',
+     'rfc': '2132'},
+ 7: {'name': 'Log Server',
+     'len': 'N',
+     'description': 'N/4 Logging Server addresses',
+     'rfc': '2132'},
+ 8: {'name': 'Quotes Server',
+     'len': 'N',
+     'description': 'N/4 Quotes Server addresses',
+     'rfc': '2132'},
+ 9: {'name': 'LPR Server',
+     'len': 'N',
+     'description': 'N/4 Printer Server addresses',
+     'rfc': '2132'},
+ 10: {'name': 'Impress Server',
+      'len': 'N',
+      'description': 'N/4 Impress Server addresses',
+      'rfc': '2132'},
+ 11: {'name': 'RLP Server',
+      'len': 'N',
+      'description': 'N/4 RLP Server addresses',
+      'rfc': '2132'},
+ 12: {'name': 'Hostname', 'len': 'N', 'description': 'Hostname string', 'rfc': '2132'},
+ 13: {'name': 'Boot File Size',
+      'len': 2,
+      'description': 'Size of boot file in 512 byte chunks',
+      'rfc': '2132'},
+ 14: {'name': 'Merit Dump File',
+      'len': 'N',
+      'description': 'Client to dump and name the file to dump it to',
+      'rfc': '2132'},
+ 15: {'name': 'Domain Name',
+      'len': 'N',
+      'description': 'The DNS domain name of the client',
+      'rfc': '2132'},
+ 16: {'name': 'Swap Server',
+      'len': 'N',
+      'description': 'Swap Server address',
+      'rfc': '2132'},
+ 17: {'name': 'Root Path',
+      'len': 'N',
+      'description': 'Path name for root disk',
+      'rfc': '2132'},
+ 18: {'name': 'Extension File',
+      'len': 'N',
+      'description': 'Path name for more BOOTP info',
+      'rfc': '2132'},
+ 19: {'name': 'Forward On/Off',
+      'len': 1,
+      'description': 'Enable/Disable IP Forwarding',
+      'rfc': '2132'},
+ 20: {'name': 'SrcRte On/Off',
+      'len': 1,
+      'description': 'Enable/Disable Source Routing',
+      'rfc': '2132'},
+ 21: {'name': 'Policy Filter',
+      'len': 'N',
+      'description': 'Routing Policy Filters',
+      'rfc': '2132'},
+ 22: {'name': 'Max DG Assembly',
+      'len': 2,
+      'description': 'Max Datagram Reassembly Size',
+      'rfc': '2132'},
+ 23: {'name': 'Default IP TTL',
+      'len': 1,
+      'description': 'Default IP Time to Live',
+      'rfc': '2132'},
+ 24: {'name': 'MTU Timeout',
+      'len': 4,
+      'description': 'Path MTU Aging Timeout',
+      'rfc': '2132'},
+ 25: {'name': 'MTU Plateau',
+      'len': 'N',
+      'description': 'Path MTU  Plateau Table',
+      'rfc': '2132'},
+ 26: {'name': 'MTU Interface',
+      'len': 2,
+      'description': 'Interface MTU Size',
+      'rfc': '2132'},
+ 27: {'name': 'MTU Subnet',
+      'len': 1,
+      'description': 'All Subnets are Local',
+      'rfc': '2132'},
+ 28: {'name': 'Broadcast Address',
+      'len': 4,
+      'description': 'Broadcast Address',
+      'rfc': '2132'},
+ 29: {'name': 'Mask Discovery',
+      'len': 1,
+      'description': 'Perform Mask Discovery',
+      'rfc': '2132'},
+ 30: {'name': 'Mask Supplier',
+      'len': 1,
+      'description': 'Provide Mask to Others',
+      'rfc': '2132'},
+ 31: {'name': 'Router Discovery',
+      'len': 1,
+      'description': 'Perform Router Discovery',
+      'rfc': '2132'},
+ 32: {'name': 'Router Request',
+      'len': 4,
+      'description': 'Router Solicitation Address',
+      'rfc': '2132'},
+ 33: {'name': 'Static Route',
+      'len': 'N',
+      'description': 'Static Routing Table',
+      'rfc': '2132'},
+ 34: {'name': 'Trailers',
+      'len': 1,
+      'description': 'Trailer Encapsulation',
+      'rfc': '2132'},
+ 35: {'name': 'ARP Timeout',
+      'len': 4,
+      'description': 'ARP Cache Timeout',
+      'rfc': '2132'},
+ 36: {'name': 'Ethernet',
+      'len': 1,
+      'description': 'Ethernet Encapsulation',
+      'rfc': '2132'},
+ 37: {'name': 'Default TCP TTL',
+      'len': 1,
+      'description': 'Default TCP Time to Live',
+      'rfc': '2132'},
+ 38: {'name': 'Keepalive Time',
+      'len': 4,
+      'description': 'TCP Keepalive Interval',
+      'rfc': '2132'},
+ 39: {'name': 'Keepalive Data',
+      'len': 1,
+      'description': 'TCP Keepalive Garbage',
+      'rfc': '2132'},
+ 40: {'name': 'NIS Domain',
+      'len': 'N',
+      'description': 'NIS Domain Name',
+      'rfc': '2132'},
+ 41: {'name': 'NIS Servers',
+      'len': 'N',
+      'description': 'NIS Server Addresses',
+      'rfc': '2132'},
+ 42: {'name': 'NTP Servers',
+      'len': 'N',
+      'description': 'NTP Server Addresses',
+      'rfc': '2132'},
+ 43: {'name': 'Vendor Specific',
+      'len': 'N',
+      'description': 'Vendor Specific Information',
+      'rfc': '2132'},
+ 44: {'name': 'NETBIOS Name Srv',
+      'len': 'N',
+      'description': 'NETBIOS Name Servers',
+      'rfc': '2132'},
+ 45: {'name': 'NETBIOS Dist Srv',
+      'len': 'N',
+      'description': 'NETBIOS Datagram Distribution',
+      'rfc': '2132'},
+ 46: {'name': 'NETBIOS Node Type',
+      'len': 1,
+      'description': 'NETBIOS Node Type',
+      'rfc': '2132'},
+ 47: {'name': 'NETBIOS Scope',
+      'len': 'N',
+      'description': 'NETBIOS Scope',
+      'rfc': '2132'},
+ 48: {'name': 'X Window Font',
+      'len': 'N',
+      'description': 'X Window Font Server',
+      'rfc': '2132'},
+ 49: {'name': 'X Window Manager',
+      'len': 'N',
+      'description': 'X Window Display Manager',
+      'rfc': '2132'},
+ 50: {'name': 'Address Request',
+      'len': 4,
+      'description': 'Requested IP Address',
+      'rfc': '2132'},
+ 51: {'name': 'Address Time',
+      'len': 4,
+      'description': 'IP Address Lease Time',
+      'rfc': '2132'},
+ 52: {'name': 'Overload',
+      'len': 1,
+      'description': 'Overload "sname" or "file"',
+      'rfc': '2132'},
+ 53: {'name': 'DHCP Msg Type',
+      'len': 1,
+      'description': 'DHCP Message Type',
+      'rfc': '2132'},
+ 54: {'name': 'DHCP Server Id',
+      'len': 4,
+      'description': 'DHCP Server Identification',
+      'rfc': '2132'},
+ 55: {'name': 'Parameter List',
+      'len': 'N',
+      'description': 'Parameter Request List',
+      'rfc': '2132'},
+ 56: {'name': 'DHCP Message',
+      'len': 'N',
+      'description': 'DHCP Error Message',
+      'rfc': '2132'},
+ 57: {'name': 'DHCP Max Msg Size',
+      'len': 2,
+      'description': 'DHCP Maximum Message Size',
+      'rfc': '2132'},
+ 58: {'name': 'Renewal Time',
+      'len': 4,
+      'description': 'DHCP Renewal (T1) Time',
+      'rfc': '2132'},
+ 59: {'name': 'Rebinding Time',
+      'len': 4,
+      'description': 'DHCP Rebinding (T2) Time',
+      'rfc': '2132'},
+ 60: {'name': 'Class Id', 'len': 'N', 'description': 'Class Identifier', 'rfc': '2132'},
+ 61: {'name': 'Client Id',
+      'len': 'N',
+      'description': 'Client Identifier',
+      'rfc': '2132'},
+ 62: {'name': 'NetWare/IP Domain',
+      'len': 'N',
+      'description': 'NetWare/IP Domain Name',
+      'rfc': '2242'},
+ 63: {'name': 'NetWare/IP Option',
+      'len': 'N',
+      'description': 'NetWare/IP sub Options',
+      'rfc': '2242'},
+ 64: {'name': 'NIS-Domain-Name',
+      'len': 'N',
+      'description': 'NIS+ v3 Client Domain Name',
+      'rfc': '2132'},
+ 65: {'name': 'NIS-Server-Addr',
+      'len': 'N',
+      'description': 'NIS+ v3 Server Addresses',
+      'rfc': '2132'},
+ 66: {'name': 'Server-Name',
+      'len': 'N',
+      'description': 'TFTP Server Name',
+      'rfc': '2132'},
+ 67: {'name': 'Bootfile-Name',
+      'len': 'N',
+      'description': 'Boot File Name',
+      'rfc': '2132'},
+ 68: {'name': 'Home-Agent-Addrs',
+      'len': 'N',
+      'description': 'Home Agent Addresses',
+      'rfc': '2132'},
+ 69: {'name': 'SMTP-Server',
+      'len': 'N',
+      'description': 'Simple Mail Server Addresses',
+      'rfc': '2132'},
+ 70: {'name': 'POP3-Server',
+      'len': 'N',
+      'description': 'Post Office Server Addresses',
+      'rfc': '2132'},
+ 71: {'name': 'NNTP-Server',
+      'len': 'N',
+      'description': 'Network News Server Addresses',
+      'rfc': '2132'},
+ 72: {'name': 'WWW-Server',
+      'len': 'N',
+      'description': 'WWW Server Addresses',
+      'rfc': '2132'},
+ 73: {'name': 'Finger-Server',
+      'len': 'N',
+      'description': 'Finger Server Addresses',
+      'rfc': '2132'},
+ 74: {'name': 'IRC-Server',
+      'len': 'N',
+      'description': 'Chat Server Addresses',
+      'rfc': '2132'},
+ 75: {'name': 'StreetTalk-Server',
+      'len': 'N',
+      'description': 'StreetTalk Server Addresses',
+      'rfc': '2132'},
+ 76: {'name': 'STDA-Server',
+      'len': 'N',
+      'description': 'ST Directory Assist. Addresses',
+      'rfc': '2132'},
+ 77: {'name': 'User-Class',
+      'len': 'N',
+      'description': 'User Class Information',
+      'rfc': '3004'},
+ 78: {'name': 'Directory Agent',
+      'len': 'N',
+      'description': 'directory agent information',
+      'rfc': '2610'},
+ 79: {'name': 'Service Scope',
+      'len': 'N',
+      'description': 'service location agent scope',
+      'rfc': '2610'},
+ 80: {'name': 'Rapid Commit', 'len': 0, 'description': 'Rapid Commit', 'rfc': '4039'},
+ 81: {'name': 'Client FQDN',
+      'len': 'N',
+      'description': 'Fully Qualified Domain Name',
+      'rfc': '4702'},
+ 82: {'name': 'Relay Agent Information',
+      'len': 'N',
+      'description': 'Relay Agent Information',
+      'rfc': '3046'},
+ 83: {'name': 'iSNS',
+      'len': 'N',
+      'description': 'Internet Storage Name Service',
+      'rfc': '4174'},
+ 84: {'name': 'REMOVED/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 85: {'name': 'NDS Servers',
+      'len': 'N',
+      'description': 'Novell Directory Services',
+      'rfc': '2241'},
+ 86: {'name': 'NDS Tree Name',
+      'len': 'N',
+      'description': 'Novell Directory Services',
+      'rfc': '2241'},
+ 87: {'name': 'NDS Context',
+      'len': 'N',
+      'description': 'Novell Directory Services',
+      'rfc': '2241'},
+ 88: {'name': 'BCMCS Controller Domain Name list',
+      'len': '',
+      'description': '',
+      'rfc': '4280'},
+ 89: {'name': 'BCMCS Controller IPv4 address option',
+      'len': '',
+      'description': '',
+      'rfc': '4280'},
+ 90: {'name': 'Authentication',
+      'len': 'N',
+      'description': 'Authentication',
+      'rfc': '3118'},
+ 91: {'name': 'client-last-transaction-time option',
+      'len': '',
+      'description': '',
+      'rfc': '4388'},
+ 92: {'name': 'associated-ip option', 'len': '', 'description': '', 'rfc': '4388'},
+ 93: {'name': 'Client System',
+      'len': 'N',
+      'description': 'Client System Architecture',
+      'rfc': '4578'},
+ 94: {'name': 'Client NDI',
+      'len': 'N',
+      'description': 'Client Network Device Interface',
+      'rfc': '4578'},
+ 95: {'name': 'LDAP',
+      'len': 'N',
+      'description': 'Lightweight Directory Access Protocol',
+      'rfc': '3679'},
+ 96: {'name': 'REMOVED/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 97: {'name': 'UUID/GUID',
+      'len': 'N',
+      'description': 'UUID/GUID-based Client Identifier',
+      'rfc': '4578'},
+ 98: {'name': 'User-Auth',
+      'len': 'N',
+      'description': "Open Group's User Authentication",
+      'rfc': '2485'},
+ 99: {'name': 'GEOCONF_CIVIC', 'len': '', 'description': '', 'rfc': '4776'},
+ 100: {'name': 'PCode',
+       'len': 'N',
+       'description': 'IEEE 1003.1 TZ String',
+       'rfc': '4833'},
+ 101: {'name': 'TCode',
+       'len': 'N',
+       'description': 'Reference to the TZ Database',
+       'rfc': '4833'},
+ 108: {'name': 'REMOVED/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 109: {'name': 'OPTION_DHCP4O6_S46_SADDR',
+       'len': 16,
+       'description': 'DHCPv4 over DHCPv6 Softwire Source Address Option',
+       'rfc': '8539'},
+ 110: {'name': 'REMOVED/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 111: {'name': 'Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 112: {'name': 'Netinfo Address',
+       'len': 'N',
+       'description': 'NetInfo Parent Server Address',
+       'rfc': '3679'},
+ 113: {'name': 'Netinfo Tag',
+       'len': 'N',
+       'description': 'NetInfo Parent Server Tag',
+       'rfc': '3679'},
+ 114: {'name': 'URL', 'len': 'N', 'description': 'URL', 'rfc': '3679'},
+ 115: {'name': 'REMOVED/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 116: {'name': 'Auto-Config',
+       'len': 'N',
+       'description': 'DHCP Auto-Configuration',
+       'rfc': '2563'},
+ 117: {'name': 'Name Service Search',
+       'len': 'N',
+       'description': 'Name Service Search',
+       'rfc': '2937'},
+ 118: {'name': 'Subnet Selection Option',
+       'len': 4,
+       'description': 'Subnet Selection Option',
+       'rfc': '3011'},
+ 119: {'name': 'Domain Search',
+       'len': 'N',
+       'description': 'DNS domain search list',
+       'rfc': '3397'},
+ 120: {'name': 'SIP Servers DHCP Option',
+       'len': 'N',
+       'description': 'SIP Servers DHCP Option',
+       'rfc': '3361'},
+ 121: {'name': 'Classless Static Route Option',
+       'len': 'N',
+       'description': 'Classless Static Route Option',
+       'rfc': '3442'},
+ 122: {'name': 'CCC',
+       'len': 'N',
+       'description': 'CableLabs Client Configuration',
+       'rfc': '3495'},
+ 123: {'name': 'GeoConf Option',
+       'len': 16,
+       'description': 'GeoConf Option',
+       'rfc': '6225'},
+ 124: {'name': 'V-I Vendor Class',
+       'len': '',
+       'description': 'Vendor-Identifying Vendor Class',
+       'rfc': '3925'},
+ 125: {'name': 'V-I Vendor-Specific Information',
+       'len': '',
+       'description': 'Vendor-Identifying Vendor-Specific Information',
+       'rfc': '3925'},
+ 126: {'name': 'Removed/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 127: {'name': 'Removed/Unassigned', 'len': '', 'description': '', 'rfc': '3679'},
+ 128: {'name': 'TFTP Server IP address (for IP\nPhone software load)',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 129: {'name': 'Call Server IP address', 'len': '', 'description': '', 'rfc': ''},
+ 130: {'name': 'Discrimination string (to\nidentify vendor)',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 131: {'name': 'Remote statistics server IP address',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 132: {'name': 'IEEE 802.1Q VLAN ID', 'len': '', 'description': '', 'rfc': ''},
+ 133: {'name': 'IEEE 802.1D/p Layer 2 Priority',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 134: {'name': 'Diffserv Code Point (DSCP) for\nVoIP signalling and media streams',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 135: {'name': 'HTTP Proxy for phone-specific\napplications',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 136: {'name': 'OPTION_PANA_AGENT', 'len': '', 'description': '', 'rfc': '5192'},
+ 137: {'name': 'OPTION_V4_LOST', 'len': '', 'description': '', 'rfc': '5223'},
+ 138: {'name': 'OPTION_CAPWAP_AC_V4',
+       'len': 'N',
+       'description': 'CAPWAP Access Controller addresses',
+       'rfc': '5417'},
+ 139: {'name': 'OPTION-IPv4_Address-MoS',
+       'len': 'N',
+       'description': 'a series of suboptions',
+       'rfc': '5678'},
+ 140: {'name': 'OPTION-IPv4_FQDN-MoS',
+       'len': 'N',
+       'description': 'a series of suboptions',
+       'rfc': '5678'},
+ 141: {'name': 'SIP UA Configuration Service Domains',
+       'len': 'N',
+       'description': 'List of domain names to search for SIP User Agent Configuration',
+       'rfc': '6011'},
+ 142: {'name': 'OPTION-IPv4_Address-ANDSF',
+       'len': 'N',
+       'description': 'ANDSF IPv4 Address Option for DHCPv4',
+       'rfc': '6153'},
+ 143: {'name': 'OPTION_V4_SZTP_REDIRECT',
+       'len': 'N',
+       'description': 'This option provides a list of URIs for SZTP bootstrap servers',
+       'rfc': '8572'},
+ 144: {'name': 'GeoLoc',
+       'len': 16,
+       'description': 'Geospatial Location with Uncertainty',
+       'rfc': '6225'},
+ 145: {'name': 'FORCERENEW_NONCE_CAPABLE',
+       'len': 1,
+       'description': 'Forcerenew Nonce Capable',
+       'rfc': '6704'},
+ 146: {'name': 'RDNSS Selection',
+       'len': 'N',
+       'description': 'Information for selecting RDNSS',
+       'rfc': '6731'},
+ 150: {'name': 'GRUB configuration path name', 'len': '', 'description': '', 'rfc': ''},
+ 151: {'name': 'status-code',
+       'len': 'N+1',
+       'description': 'Status code and optional N byte text message describing status.',
+       'rfc': '6926'},
+ 152: {'name': 'base-time',
+       'len': 4,
+       'description': 'Absolute time (seconds since Jan 1, 1970) message was sent.',
+       'rfc': '6926'},
+ 153: {'name': 'start-time-of-state',
+       'len': 4,
+       'description': 'Number of seconds in the past when client entered current '
+                      'state.',
+       'rfc': '6926'},
+ 154: {'name': 'query-start-time',
+       'len': 4,
+       'description': 'Absolute time (seconds since Jan 1, 1970) for beginning of '
+                      'query.',
+       'rfc': '6926'},
+ 155: {'name': 'query-end-time',
+       'len': 4,
+       'description': 'Absolute time (seconds since Jan 1, 1970) for end of query.',
+       'rfc': '6926'},
+ 156: {'name': 'dhcp-state',
+       'len': 1,
+       'description': 'State of IP address.',
+       'rfc': '6926'},
+ 157: {'name': 'data-source',
+       'len': 1,
+       'description': 'Indicates information came from local or remote server.',
+       'rfc': '6926'},
+ 158: {'name': 'OPTION_V4_PCP_SERVER',
+       'len': 'Variable; the minimum length is 5.',
+       'description': 'Includes one or multiple lists of PCP server IP addresses; \n'
+                      '      each list is treated as a separate PCP server.',
+       'rfc': '7291'},
+ 159: {'name': 'OPTION_V4_PORTPARAMS',
+       'len': 4,
+       'description': 'This option is used to configure a set of ports bound to a \n'
+                      '      shared IPv4 address.',
+       'rfc': '7618'},
+ 160: {'name': 'DHCP Captive-Portal',
+       'len': 'N',
+       'description': 'DHCP Captive-Portal',
+       'rfc': '7710'},
+ 161: {'name': 'OPTION_MUD_URL_V4',
+       'len': 'N (variable)',
+       'description': 'Manufacturer Usage Descriptions',
+       'rfc': '8520'},
+ 175: {'name': 'Etherboot (Tentatively Assigned -\n2005-06-23)',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 176: {'name': 'IP Telephone (Tentatively Assigned -\n2005-06-23)',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 177: {'name': 'PacketCable and CableHome (replaced by\n122)',
+       'len': '',
+       'description': '',
+       'rfc': ''},
+ 208: {'name': 'PXELINUX Magic',
+       'len': 4,
+       'description': 'magic string = F1:00:74:7E',
+       'rfc': '5071][Deprecated'},
+ 209: {'name': 'Configuration File',
+       'len': 'N',
+       'description': 'Configuration file',
+       'rfc': '5071'},
+ 210: {'name': 'Path Prefix',
+       'len': 'N',
+       'description': 'Path Prefix Option',
+       'rfc': '5071'},
+ 211: {'name': 'Reboot Time', 'len': 4, 'description': 'Reboot Time', 'rfc': '5071'},
+ 212: {'name': 'OPTION_6RD',
+       'len': '18 + N',
+       'description': 'OPTION_6RD with N/4 6rd BR addresses',
+       'rfc': '5969'},
+ 213: {'name': 'OPTION_V4_ACCESS_DOMAIN',
+       'len': 'N',
+       'description': 'Access Network Domain Name',
+       'rfc': '5986'},
+ 220: {'name': 'Subnet Allocation Option',
+       'len': 'N',
+       'description': 'Subnet Allocation Option',
+       'rfc': '6656'},
+ 221: {'name': 'Virtual Subnet Selection (VSS) Option',
+       'len': '',
+       'description': '',
+       'rfc': '6607'},
+ 255: {'name': 'End', 'len': 0, 'description': 'None', 'rfc': '2132'}}
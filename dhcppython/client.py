@@ -1,24 +1,133 @@
+import ctypes
+import errno
 import logging
+import struct
+import sys
+import random
 import socket
-import select
-from typing import Tuple, List, Optional
+import selectors
+from typing import Dict, Tuple, List, Optional
 from timeit import default_timer
 from time import sleep
+from time import monotonic
 import json
 import collections
 from . import packet, options, utils
 from .exceptions import DHCPClientError
 
-
 COL_LEN = 80
 
+
+# sendmmsg/recvmmsg let us move a batch of UDP packets with a single syscall.
+# CPython does not expose them, so go through libc where present (Linux);
+# everywhere else callers fall back to one sendto/recvfrom per packet.
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr), ("msg_len", ctypes.c_uint)]
+
+
+class _sockaddr_in(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_uint16),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_uint32),
+        ("sin_zero", ctypes.c_char * 8),
+    ]
+
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _sendmmsg = _libc.sendmmsg
+    _recvmmsg = _libc.recvmmsg
+except (OSError, AttributeError, TypeError):
+    # TypeError: Windows rejects CDLL(None) outright
+    _sendmmsg = None
+    _recvmmsg = None
+
 Lease = collections.namedtuple(
     "Lease", ["discover", "offer", "request", "ack", "time", "server"]
 )
 
+# Precompiled once; Struct.unpack_from skips the per-call format parse that
+# struct.unpack / int.from_bytes pay for
+_XID_AT_4 = struct.Struct("!I")
+
+MSG_TYPE_CODES = {
+    "DHCPDISCOVER": 1,
+    "DHCPOFFER": 2,
+    "DHCPREQUEST": 3,
+    "DHCPDECLINE": 4,
+    "DHCPACK": 5,
+    "DHCPNAK": 6,
+    "DHCPRELEASE": 7,
+    "DHCPINFORM": 8,
+}
+
+
+def _peek_msg_type_and_xid(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Cheaply extract (xid, msg type code) from a raw packet without building
+    any DHCPPacket or Option objects, so that stray traffic can be rejected
+    before paying for a full parse. Returns None for malformed packets.
+    """
+    cookie_start = packet.DHCPPacket.cookie_offset_start
+    cookie_end = packet.DHCPPacket.cookie_offset_end
+    if (
+        len(data) <= cookie_end
+        or data[cookie_start:cookie_end] != packet.DHCPPacket.magic_cookie
+    ):
+        return None
+    xid = _XID_AT_4.unpack_from(data, 4)[0]
+    read_pos = cookie_end
+    end = len(data)
+    while read_pos < end:
+        code = data[read_pos]
+        if code == 255:
+            break
+        if code == 0:
+            read_pos += 1
+            continue
+        if read_pos + 1 >= end:
+            return None
+        length = data[read_pos + 1]
+        if code == 53:
+            if length != 1 or read_pos + 2 >= end:
+                return None
+            return xid, data[read_pos + 2]
+        read_pos += 2 + length
+    return None
+
+
+# The same packet is commonly formatted more than once (on receive and again
+# in the lease dump) - cache the rendered output. The wire bytes alone are
+# not a safe key: chaddr letter case and Pad/End objects held in pkt.options
+# change the rendering without changing the serialized packet, so they are
+# part of the key too
+_format_cache: Dict[Tuple[bytes, str, Tuple[int, ...]], str] = {}
+_FORMAT_CACHE_MAX_SIZE = 128
+
 
 def format_dhcp_packet(pkt: packet.DHCPPacket) -> str:
-    line_divider = ";-" + "".ljust(COL_LEN, "-") + ";\n"
+    wire = pkt.asbytes
+    cache_key = (wire, pkt.chaddr, tuple(opt.code for opt in pkt.options))
+    if (cached := _format_cache.get(cache_key)) is not None:
+        return cached
+    line_divider = ";-" + "".ljust(COL_LEN, "-") + ";"
     options_list = options.OptionList(pkt.options)
     msg_type_option = options_list.by_code(53)
     padding = " "
@@ -36,44 +145,33 @@ def format_dhcp_packet(pkt: packet.DHCPPacket) -> str:
     ) > 0:
         client_info = client_info[:-visual_diff]
 
-    output = (
-        f"{pkt.op} / {msg_type} / {broadcast}\n"
-        + f"{len(pkt.asbytes)} bytes / TX ID {hex(pkt.xid).upper()} / {pkt.secs} seconds elapsed\n"
-        + "Client info:".ljust(client_info_padding)
-        + client_info
-        + "\n"
-        + "Client address:".ljust(client_info_padding)
-        + f"{pkt.ciaddr}\n"
-        + "Your address:".ljust(client_info_padding)
-        + f"{pkt.yiaddr}\n"
-        + "Next server:".ljust(client_info_padding)
-        + f"{pkt.siaddr}\n"
-        + "Relay:".ljust(client_info_padding)
-        + f"{pkt.giaddr}"
-    )
-
-    output = (
-        "\n".join(
-            [
-                f"; {line.ljust(COL_LEN if utils.visual_length(line) < COL_LEN else 0, padding)};"
-                for line in output.split("\n")
-            ]
-        )
-        + "\n"
-    )
-    output = line_divider + output + line_divider
-    output += "; " + "OPTIONS:".ljust(COL_LEN, padding) + ";\n"
-    output += (
-        "\n".join(
-            [
-                f"; {line.ljust(COL_LEN, padding)};"
-                for line in options_list.json.split("\n")
-            ]
-        )
-        + "\n"
-    )
-    output += line_divider
+    header_lines = [
+        f"{pkt.op} / {msg_type} / {broadcast}",
+        f"{len(wire)} bytes / TX ID {hex(pkt.xid).upper()} / {pkt.secs} seconds elapsed",
+        "Client info:".ljust(client_info_padding) + client_info,
+        "Client address:".ljust(client_info_padding) + f"{pkt.ciaddr_ip}",
+        "Your address:".ljust(client_info_padding) + f"{pkt.yiaddr_ip}",
+        "Next server:".ljust(client_info_padding) + f"{pkt.siaddr_ip}",
+        "Relay:".ljust(client_info_padding) + f"{pkt.giaddr_ip}",
+    ]
+
+    lines = [line_divider]
+    lines += [
+        f"; {line.ljust(COL_LEN if utils.visual_length(line) < COL_LEN else 0, padding)};"
+        for line in header_lines
+    ]
+    lines.append(line_divider)
+    lines.append("; " + "OPTIONS:".ljust(COL_LEN, padding) + ";")
+    lines += [
+        f"; {line.ljust(COL_LEN, padding)};"
+        for line in options_list.json.split("\n")
+    ]
+    lines.append(line_divider)
+    output = "\n".join(lines) + "\n"
 
+    if len(_format_cache) >= _FORMAT_CACHE_MAX_SIZE:
+        _format_cache.clear()
+    _format_cache[cache_key] = output
     return output
 
 
@@ -86,26 +184,60 @@ class DHCPClient(object):
         max_retries: int = 10,
         socket_poll_interval: int = 10,
         retry_interval: int = 100,
+        rcvbuf: int = 4_000_000,
+        sndbuf: int = 4_000_000,
+        backoff_cap: int = 64000,
+        initial_interval: Optional[int] = None,
     ):
         self.listening_ports = [67]
         self.send_from_port = send_from_port
         self.send_to_port = send_to_port
         self.max_pkt_size = 4096
+        # Reusable receive buffer so listen does not allocate a fresh bytes
+        # object for every poll
+        self._rx_buf = bytearray(self.max_pkt_size)
+        self._rx_mv = memoryview(self._rx_buf)
         self.interface = interface
+        # Requested kernel buffer sizes; sizes above net.core.rmem_max /
+        # net.core.wmem_max are silently capped by the kernel
+        self.rcvbuf = rcvbuf
+        self.sndbuf = sndbuf
         self.listening_sockets = self.get_listening_sockets()
         self.writing_sockets = self.get_writing_sockets()
         self.listening_sockets += self.writing_sockets
         # self.listening_sockets += self.writing_sockets
-        logging.debug(f"listening sockets: {self.listening_sockets}")
-        logging.debug(f"write sockets: {self.writing_sockets}")
+        logging.debug("listening sockets: %s", self.listening_sockets)
+        logging.debug("write sockets: %s", self.writing_sockets)
         self.except_sockets: List[socket.socket] = []
+        # Everything is registered read-only: a UDP socket is nearly always
+        # write-ready, so keeping EVENT_WRITE registered here would make
+        # listen's select return immediately on every call. send flips the
+        # writer to EVENT_WRITE just for the duration of its wait
+        self._sel = selectors.DefaultSelector()
+        for sock in self.listening_sockets:
+            self._sel.register(sock, selectors.EVENT_READ)
         self.max_tries = max_retries
         self.socket_poll_interval = socket_poll_interval
         self.retry_interval = retry_interval
-        self.select_timout = 0
+        # Cap on the exponential backoff, 64 s per RFC 2131 section 4.1
+        self.backoff_cap = backoff_cap
+        self.initial_interval = initial_interval or retry_interval
+        # Block in the selector for up to socket_poll_interval instead of
+        # polling with a zero timeout and sleeping in userspace; the kernel
+        # wakes us as soon as a packet arrives
+        self.select_timout = self.socket_poll_interval / 1000
         self.offer_servers: List[str] = []
         self.ack_server: str = ""
 
+    def backoff_delay(self, base_interval: int, tries: int) -> float:
+        """
+        Exponential backoff with full jitter, returns a delay in seconds.
+        """
+        return (
+            random.uniform(0, min(self.backoff_cap, base_interval * (2 ** tries)))
+            / 1000
+        )
+
     def send_discover(
         self, server: str, discover_packet: packet.DHCPPacket, verbosity: int
     ):
@@ -117,7 +249,7 @@ class DHCPClient(object):
             print("Listening for OFFER packet")
         offer, addr = self.listen(tx_id, "DHCPOFFER", verbosity)
         if offer:
-            logging.debug(f"Received offer packet from {addr} {offer}")
+            logging.debug("Received offer packet from %s %s", addr, offer)
             if verbosity > 1:
                 print(f"<< OFFER received from {addr[0]}:{addr[1]}")
                 print(format_dhcp_packet(offer))
@@ -139,7 +271,7 @@ class DHCPClient(object):
             print("Listening for ACK packet")
         ack, addr = self.listen(tx_id, "DHCPACK", verbosity)
         if ack:
-            logging.debug(f"Received ack packet from {addr} {ack}")
+            logging.debug("Received ack packet from %s %s", addr, ack)
             if verbosity:
                 print(f"<< ACK received from {addr[0]}:{addr[1]}")
                 print(format_dhcp_packet(ack))
@@ -161,6 +293,12 @@ class DHCPClient(object):
         verbose: int = 0,
     ) -> Lease:
         mac_addr = mac_addr or utils.random_mac()
+        # Bind the hot-loop methods once instead of doing an attribute walk
+        # on every retry iteration
+        send_discover = self.send_discover
+        receive_offer = self.receive_offer
+        send_request = self.send_request
+        receive_ack = self.receive_ack
         logging.debug("Synthetizing discover packet")
 
         # D
@@ -168,23 +306,27 @@ class DHCPClient(object):
             mac_addr, use_broadcast=broadcast, option_list=options_list, relay=relay
         )
         tx_id = discover.xid
-        logging.debug(f"Constructed discover packet: {discover}")
+        logging.debug("Constructed discover packet: %s", discover)
         if verbose > 1:
             print(format_dhcp_packet(discover))
         start = default_timer()
-        logging.debug(f"Sending discover packet to {server} with {tx_id=}")
-        self.send_discover(server, discover, verbose)
+        logging.debug("Sending discover packet to %s with tx_id=%s", server, tx_id)
+        send_discover(server, discover, verbose)
         # O
         tries = 0
-        while not (offer := self.receive_offer(tx_id, verbose)):
-            logging.debug(f"Sleeping {self.retry_interval} ms then retrying discover")
-            sleep(self.retry_interval / 1000)
+        while not (offer := receive_offer(tx_id, verbose)):
+            delay = self.backoff_delay(self.initial_interval, tries)
+            logging.debug("Sleeping %.0f ms then retrying discover", delay * 1000)
+            sleep(delay)
             logging.debug(
-                f"Attempt {tries} - Sending discover packet to {server} with {tx_id=}"
+                "Attempt %s - Sending discover packet to %s with tx_id=%s",
+                tries,
+                server,
+                tx_id,
             )
             if verbose > 1:
                 print("Resending DISCOVER packet")
-            self.send_discover(server, discover, verbose)
+            send_discover(server, discover, verbose)
             if tries > self.max_tries:
                 raise DHCPClientError(
                     "Unable to obtain offer run client with -d for debug info"
@@ -203,20 +345,24 @@ class DHCPClient(object):
         if verbose > 1:
             print("REQUEST Packet")
             print(format_dhcp_packet(request))
-        logging.debug(f"Constructed request packet: {request}")
-        logging.debug(f"Sending request packet to {server} with {tx_id=}")
-        self.send_request(server, request, verbose)
+        logging.debug("Constructed request packet: %s", request)
+        logging.debug("Sending request packet to %s with tx_id=%s", server, tx_id)
+        send_request(server, request, verbose)
         # A
         tries = 0
-        while not (ack := self.receive_ack(tx_id, verbose)):
-            logging.debug(f"Sleeping {self.retry_interval} ms then retrying request")
-            sleep(self.retry_interval / 1000)
+        while not (ack := receive_ack(tx_id, verbose)):
+            delay = self.backoff_delay(self.initial_interval, tries)
+            logging.debug("Sleeping %.0f ms then retrying request", delay * 1000)
+            sleep(delay)
             logging.debug(
-                f"Attempt {tries} - Sending request packet to {server} with {tx_id=}"
+                "Attempt %s - Sending request packet to %s with tx_id=%s",
+                tries,
+                server,
+                tx_id,
             )
             if verbose > 1:
                 print("Resending REQUEST packet")
-            self.send_request(server, request, verbose)
+            send_request(server, request, verbose)
             if tries > self.max_tries:
                 raise DHCPClientError(
                     "Unable to obtain ack run client with -d for debug info"
@@ -230,7 +376,7 @@ class DHCPClient(object):
             print(f"Client terminated after {lease_time * 1000:.0f} ms")
         else:
             print(
-                f"Lease succesful: {ack.yiaddr} -- {ack.chaddr} -- {lease_time * 1000:.0f} ms elapsed"
+                f"Lease succesful: {ack.yiaddr_ip} -- {ack.chaddr} -- {lease_time * 1000:.0f} ms elapsed"
             )
         return lease
 
@@ -240,7 +386,7 @@ class DHCPClient(object):
             pkt = packet.DHCPPacket.from_bytes(data)
         except Exception as e:
             logging.debug(
-                f"Unable to parse received data as DHCP packet: {e} --- {data!r}"
+                "Unable to parse received data as DHCP packet: %s --- %r", e, data
             )
         return pkt
 
@@ -248,72 +394,119 @@ class DHCPClient(object):
         self, tx_id: int, msg_type: str, verbosity: int
     ) -> Tuple[Optional[packet.DHCPPacket], Optional[str]]:
         logging.debug(
-            f"Listening on {self.interface or 'all interfaces'}, UDP ports {self.listening_ports}"
+            "Listening on %s, UDP ports %s",
+            self.interface or "all interfaces",
+            self.listening_ports,
         )
-        tries = 0
         dhcp_packet, addr = None, None
-        while tries < self.max_tries:
-            logging.debug(
-                f"Select: {select.select(self.listening_sockets, self.writing_sockets, self.except_sockets, 0)}"
-            )
+        expected_code = MSG_TYPE_CODES.get(msg_type)
+        get_valid_pkt = self.get_valid_pkt
+        # One overall listening budget rather than a retry counter; the
+        # selector blocks for whatever is left of it, so time spent parsing
+        # stray packets does not extend the wait
+        deadline = monotonic() + self.max_tries * self.socket_poll_interval / 1000
+        while (remaining := deadline - monotonic()) > 0:
             if len(
-                socks := select.select(
-                    self.listening_sockets,
-                    self.writing_sockets,
-                    self.except_sockets,
-                    self.select_timout,
-                )[0]
+                socks := [
+                    key.fileobj
+                    for key, mask in self._sel.select(timeout=remaining)
+                    if mask & selectors.EVENT_READ
+                ]
             ):
                 for sock in socks:
-                    data, addr = sock.recvfrom(self.max_pkt_size)
-                    logging.debug(f"Received data from {addr}: {data}")
-                    if (
-                        (dhcp_packet := self.get_valid_pkt(data)) is not None
-                        and dhcp_packet.xid == tx_id
-                        and dhcp_packet.msg_type == msg_type
-                    ):
-                        logging.debug(
-                            f"Received valid DHCP packet of {dhcp_packet.msg_type} type"
-                        )
-                        return dhcp_packet, addr
-                    else:
-                        if dhcp_packet is None:
-                            logging.debug("Invalid DHCP packet")
-                        elif dhcp_packet.xid != tx_id:
-                            logging.debug(
-                                f"TX ID does not match expected ID {dhcp_packet.xid} != {tx_id}"
-                            )
-                        elif (msg_type_actual := dhcp_packet.msg_type) != msg_type:
-                            logging.debug(
-                                f"DHCP message type does not match expected: {msg_type_actual} != {msg_type}"
+                    try:
+                        # Drain every packet queued on this socket in one
+                        # wake instead of going back through the selector
+                        # once per packet; the sockets are non-blocking, so
+                        # an empty queue raises BlockingIOError (no
+                        # MSG_DONTWAIT needed - it does not exist on Windows)
+                        while True:
+                            nbytes, addr = sock.recvfrom_into(
+                                self._rx_buf, self.max_pkt_size
                             )
-                        else:
-                            logging.debug("Something is wrong with this packet")
-                        logging.debug(dhcp_packet)
-                        dhcp_packet = None
-                        tries += 1
+                            data = bytes(self._rx_mv[:nbytes])
+                            logging.debug("Received data from %s: %s", addr, data)
+                            if (peeked := _peek_msg_type_and_xid(data)) is None:
+                                logging.debug("Invalid DHCP packet")
+                                continue
+                            peeked_xid, peeked_code = peeked
+                            if peeked_xid != tx_id:
+                                logging.debug(
+                                    "TX ID does not match expected ID %s != %s",
+                                    peeked_xid,
+                                    tx_id,
+                                )
+                                continue
+                            if peeked_code != expected_code:
+                                logging.debug(
+                                    "DHCP message type does not match expected: %s != %s",
+                                    peeked_code,
+                                    expected_code,
+                                )
+                                continue
+                            if (
+                                (dhcp_packet := get_valid_pkt(data)) is not None
+                                and dhcp_packet.xid == tx_id
+                                and dhcp_packet.msg_type == msg_type
+                            ):
+                                logging.debug(
+                                    "Received valid DHCP packet of %s type",
+                                    dhcp_packet.msg_type,
+                                )
+                                return dhcp_packet, addr
+                            else:
+                                if dhcp_packet is None:
+                                    logging.debug("Invalid DHCP packet")
+                                elif dhcp_packet.xid != tx_id:
+                                    logging.debug(
+                                        "TX ID does not match expected ID %s != %s",
+                                        dhcp_packet.xid,
+                                        tx_id,
+                                    )
+                                elif (msg_type_actual := dhcp_packet.msg_type) != msg_type:
+                                    logging.debug(
+                                        "DHCP message type does not match expected: %s != %s",
+                                        msg_type_actual,
+                                        msg_type,
+                                    )
+                                else:
+                                    logging.debug("Something is wrong with this packet")
+                                logging.debug(dhcp_packet)
+                                dhcp_packet = None
+                    except (BlockingIOError, InterruptedError):
+                        # Socket queue drained, move on
+                        pass
             else:
                 logging.debug(
-                    f"Attempt {tries} - No sockets available to read from... "
-                    f"sleeping for {self.socket_poll_interval} ms"
+                    "No sockets readable within the remaining %.0f ms", remaining * 1000
                 )
                 if verbosity > 2:
-                    print("Did not receive packet, sleeping...")
-                tries += 1
-                sleep(self.socket_poll_interval / 1000)
+                    print("Did not receive packet, still waiting...")
         return dhcp_packet, addr
 
+    def close(self):
+        self._sel.close()
+        for sock in self.listening_sockets:
+            sock.close()
+
     def get_socket(self, host: str, port: int) -> socket.socket:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+        logging.debug(
+            "Socket buffer sizes: rcvbuf=%s sndbuf=%s",
+            sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+            sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+        )
         sock.setblocking(False)
         if self.interface:
             try:
                 # Option 25 is SO_BINDTODEVICE, allows us to specify a device
                 # to bind to with this socket
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, self.interface.encode())
-                logging.info(f"Binding to {self.interface}")
+                logging.info("Binding to %s", self.interface)
             except:
                 # Less reliable method of binding to interface, required where
                 # socket option 25 does not exist (Windows)
@@ -323,13 +516,13 @@ class DHCPClient(object):
         else:
             sock.bind((host, port))
 
-        logging.info(f"Bound {socket}")
+        logging.info("Bound %s", socket)
         return sock
 
     def get_writing_sockets(self) -> List[socket.socket]:
         host = ""
         port = self.send_from_port
-        logging.debug(f"Creating socket to send data, binding to {(host, port)}")
+        logging.debug("Creating socket to send data, binding to %s", (host, port))
         client_sock = self.get_socket(host, port)
         return [client_sock]
 
@@ -337,35 +530,135 @@ class DHCPClient(object):
         socks = []
         host = ""
         for port in self.listening_ports:
-            logging.debug(f"Creating socket to receiving data, binding to {(host, port)}")
+            logging.debug("Creating socket to receiving data, binding to %s", (host, port))
             server_sock = self.get_socket(host, port)
             socks.append(server_sock)
         return socks
 
     def send(self, remote_addr: str, remote_port: int, data: bytes, verbosity: int):
         tries = 0
-        while tries < self.max_tries:
-            logging.debug(f"Select: {select.select(self.listening_sockets, self.writing_sockets, self.except_sockets, self.select_timout,)}")
-            if len(
-                socks := select.select(
-                    self.listening_sockets,
-                    self.writing_sockets,
-                    self.except_sockets,
-                    self.select_timout,
-                )[1]
-            ):
-                sock = socks[0]
-                logging.debug(f"Connecting to {remote_addr}:{remote_port}")
-                logging.debug(f"Sending data {data!r}")
-                if verbosity > 1:
-                    print(f">> Sending packet {remote_addr}:{remote_port}")
+        writer = self.writing_sockets[0]
+        # The writer is registered read-only outside of send so that an
+        # always-write-ready UDP socket does not spin listen's selector
+        self._sel.modify(writer, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        try:
+            while tries < self.max_tries:
+                if len(
+                    socks := [
+                        key.fileobj
+                        for key, mask in self._sel.select(timeout=self.select_timout)
+                        if mask & selectors.EVENT_WRITE
+                    ]
+                ):
+                    sock = socks[0]
+                    logging.debug("Connecting to %s:%s", remote_addr, remote_port)
+                    logging.debug("Sending data %r", data)
+                    if verbosity > 1:
+                        print(f">> Sending packet {remote_addr}:{remote_port}")
+                    sock.sendto(data, (remote_addr, remote_port))
+                    logging.debug("Packet Sent")
+                    break
+                else:
+                    logging.warning(
+                        "Attempt %s - No sockets writeable within %s ms",
+                        tries,
+                        self.socket_poll_interval,
+                    )
+                    tries += 1
+        finally:
+            self._sel.modify(writer, selectors.EVENT_READ)
+
+    def send_batch(
+        self, packets: List[Tuple[str, bytes]], remote_port: Optional[int] = None
+    ) -> int:
+        """
+        Send several packets, given as (remote_addr, data) tuples, with a
+        single sendmmsg syscall where libc exposes it (Linux). Falls back to
+        one sendto per packet elsewhere. Returns the number of packets
+        handed to the kernel.
+        """
+        remote_port = remote_port or self.send_to_port
+        sock = self.writing_sockets[0]
+        if _sendmmsg is None:
+            for remote_addr, data in packets:
                 sock.sendto(data, (remote_addr, remote_port))
-                logging.debug(f"Packet Sent")
+            return len(packets)
+        n = len(packets)
+        hdrs = (_mmsghdr * n)()
+        iovs = (_iovec * n)()
+        addrs = (_sockaddr_in * n)()
+        bufs = [ctypes.create_string_buffer(data, len(data)) for _, data in packets]
+        for i, (remote_addr, data) in enumerate(packets):
+            addrs[i].sin_family = socket.AF_INET
+            addrs[i].sin_port = socket.htons(remote_port)
+            addrs[i].sin_addr = int.from_bytes(
+                socket.inet_aton(remote_addr), sys.byteorder
+            )
+            iovs[i].iov_base = ctypes.cast(bufs[i], ctypes.c_void_p)
+            iovs[i].iov_len = len(data)
+            hdrs[i].msg_hdr.msg_name = ctypes.cast(
+                ctypes.byref(addrs[i]), ctypes.c_void_p
+            )
+            hdrs[i].msg_hdr.msg_namelen = ctypes.sizeof(_sockaddr_in)
+            hdrs[i].msg_hdr.msg_iov = ctypes.pointer(iovs[i])
+            hdrs[i].msg_hdr.msg_iovlen = 1
+        sent = _sendmmsg(sock.fileno(), hdrs, n, 0)
+        if sent < 0:
+            raise OSError(ctypes.get_errno(), "sendmmsg failed")
+        logging.debug("Sent %s/%s packets via sendmmsg", sent, n)
+        return sent
+
+    def recv_batch(
+        self, max_packets: int = 16
+    ) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """
+        Drain up to max_packets queued datagrams with one recvmmsg syscall
+        per listening socket where libc exposes it (Linux). Falls back to
+        one recvfrom per packet elsewhere. Returns (data, addr) tuples.
+        """
+        results: List[Tuple[bytes, Tuple[str, int]]] = []
+        for sock in self.listening_sockets:
+            budget = max_packets - len(results)
+            if budget <= 0:
                 break
-            else:
-                logging.warning(
-                    f"Attempt {tries} - No sockets available to write to... "
-                    f"sleeping for {self.socket_poll_interval} ms"
+            if _recvmmsg is None:
+                try:
+                    while len(results) < max_packets:
+                        data, addr = sock.recvfrom(self.max_pkt_size)
+                        results.append((data, addr))
+                except (BlockingIOError, InterruptedError):
+                    pass
+                continue
+            hdrs = (_mmsghdr * budget)()
+            iovs = (_iovec * budget)()
+            addrs = (_sockaddr_in * budget)()
+            bufs = [
+                ctypes.create_string_buffer(self.max_pkt_size)
+                for _ in range(budget)
+            ]
+            for i in range(budget):
+                iovs[i].iov_base = ctypes.cast(bufs[i], ctypes.c_void_p)
+                iovs[i].iov_len = self.max_pkt_size
+                hdrs[i].msg_hdr.msg_name = ctypes.cast(
+                    ctypes.byref(addrs[i]), ctypes.c_void_p
+                )
+                hdrs[i].msg_hdr.msg_namelen = ctypes.sizeof(_sockaddr_in)
+                hdrs[i].msg_hdr.msg_iov = ctypes.pointer(iovs[i])
+                hdrs[i].msg_hdr.msg_iovlen = 1
+            received = _recvmmsg(
+                sock.fileno(), hdrs, budget, socket.MSG_DONTWAIT, None
+            )
+            if received < 0:
+                err = ctypes.get_errno()
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    # Nothing queued on this socket
+                    continue
+                raise OSError(err, "recvmmsg failed")
+            for i in range(received):
+                data = bufs[i].raw[: hdrs[i].msg_len]
+                addr = (
+                    socket.inet_ntoa(addrs[i].sin_addr.to_bytes(4, sys.byteorder)),
+                    socket.ntohs(addrs[i].sin_port),
                 )
-                tries += 1
-                sleep(self.socket_poll_interval / 1000)
+                results.append((data, addr))
+        return results
@@ -51,71 +51,152 @@ ClientIdentifier(code=61, length=7, data=b'\x01\x8cE\x00\x1dH\x16')
 ```
 """
 from __future__ import annotations
-import csv
+import array
+import functools
 from abc import ABC, abstractmethod
 import collections.abc
-from typing import Dict, Union, List, Tuple, Optional, TypedDict
-import ipaddress
+from typing import Dict, Union, List, Tuple, Optional
+import itertools
+import socket
 import struct
+import sys
 import json
-import importlib.resources
 from .exceptions import DHCPValueError
-from . import runtime_assets
-
-OPTIONS: Dict[int, Dict[str, Union[str, int]]] = {
-    int(line[0]): {
-        "name": line[1],
-        "len": int(line[2]) if line[2].isdigit() else line[2],
-        "description": line[3],
-        "rfc": line[4].split("RFC")[-1][:-1],
-    }
-    for line in csv.reader(importlib.resources.open_text(runtime_assets, "options.csv"))
-    if line[0].isdigit()
-}
+from ._options_table import OPTIONS
+
+try:
+    # Optional: bulk array decodes use numpy when it happens to be around
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_struct(fmt: str) -> struct.Struct:
+    """
+    Compiled Struct objects keyed by format string, so variable-length
+    formats are only parsed once instead of on every pack/unpack call.
+    """
+    return struct.Struct(fmt)
+
 
+# Prebound fixed-width codecs for the scalar numeric option bases; bound
+# methods skip both the module attribute lookup and the format parse
+_U16 = struct.Struct(">H").unpack
+_U32 = struct.Struct(">L").unpack
+_I32 = struct.Struct(">l").unpack
+_P16 = struct.Struct(">H").pack
+_P32 = struct.Struct(">L").pack
+_PI32 = struct.Struct(">l").pack
 
-class CodeDataMapping(TypedDict):
-    obj: Option
-    index: int
+# Byte value -> "0xNN" strings, precomputed so data2bin does one list index
+# per byte instead of an f-string format evaluation
+_HEX = [f"0x{i:02X}" for i in range(256)]
+
+# Explicit registries of the concrete option classes, populated as each
+# class is defined; OptionDirectory just hands out references to these
+_OPTION_REGISTRY: Dict[int, type] = {}
+_KEY_CODE_MAP: Dict[str, int] = {}
+
+# Option codes are single bytes, so code -> class dispatch is a flat
+# 256-slot table indexed directly; filled alongside _OPTION_REGISTRY.
+# Unlike a memoized dict lookup it also stays correct if an option
+# class is registered after the first parse
+_CODE_TABLE: List[Optional[type]] = [None] * 256
+
+
+def _code_to_class(code: Optional[int]) -> type:
+    # code is None when an unknown value key failed to resolve to a code
+    cls = _CODE_TABLE[code] if code is not None and 0 <= code < 256 else None
+    return cls if cls is not None else UnknownOption
+
+
+@functools.lru_cache(maxsize=512)
+def _key_to_code(key: str) -> Optional[int]:
+    return _KEY_CODE_MAP.get(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_tlv(tlv: bytes) -> "Option":
+    """
+    Parses one non-Pad/End TLV into its Option object.
+
+    DHCP traffic repeats the same short options constantly (message
+    types, parameter request lists, recurring client identifiers), and
+    options are immutable, so memoizing on the raw TLV bytes lets repeat
+    options share one object - and its cached value - across packets.
+    """
+    code = tlv[0]
+    return _code_to_class(code)(code, tlv[1], tlv[2:])
+
+
+class _cached_value:
+    """
+    functools.cached_property needs an instance __dict__, which the
+    __slots__ on Option removes; this descriptor gives the same one-shot
+    compute but backs the cache with the _value slot.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        val = obj._value
+        if val is None:
+            val = obj._value = self.func(obj)
+        return val
 
 
 class OptionList(collections.abc.MutableSequence):
     def __init__(self, options_array: Optional[List[Option]] = None):
         self.data: List[Option] = list(options_array) if options_array else []
-        self.code_to_data: Dict[int, CodeDataMapping] = {
-            opt.code: {"obj": opt, "index": i} for i, opt in enumerate(self.data)
-        }
+        # Maps code -> Option only; positions live solely in self.data so
+        # mutations never have to reindex the whole list
+        self.code_to_data: Dict[int, Option] = {opt.code: opt for opt in self.data}
+        # Occurrences per code; lists built from raw data can carry
+        # duplicates (e.g. pad options), and the counts let the index be
+        # maintained incrementally instead of rebuilt on delete
+        self._code_counts = collections.Counter(opt.code for opt in self.data)
+        # Mutation counter; as_dict/json results are memoized against it
+        self._version: int = 0
+        self._dict_cache = (-1, {})
+        self._json_cache = (-1, "")
 
     def __repr__(self):
         return f"OptionList({self.data})"
 
     def by_code(self, code: int) -> Optional[Option]:
-        return self.code_to_data.get(code, {}).get("obj")
+        return self.code_to_data.get(code)
+
+    def index_of_code(self, code: int) -> Optional[int]:
+        for i, opt in enumerate(self.data):
+            if opt.code == code:
+                return i
+        return None
 
     def append(self, item: Option):
         if item.code not in self.code_to_data:
             self.data.append(item)
-            self.code_to_data[item.code] = {"obj": item, "index": len(self.data) - 1}
+            self._code_counts[item.code] += 1
         else:
-            self.data[self.code_to_data[item.code]["index"]] = item
-            self.code_to_data[item.code]["obj"] = item
+            self.data[self.index_of_code(item.code)] = item
+        self.code_to_data[item.code] = item
+        self._version += 1
 
     def insert(self, index: int, obj: Option):
         if obj.code in self.code_to_data:
             # delete previous object and insert this one at the specified pos
-            del self[self.code_to_data[obj.code]["index"]]
-
-        self.data.insert(index, obj)
-
-        # Re-index entire list...
-        for opt in self.code_to_data.values():
-            if opt["index"] >= index:
-                opt["index"] += 1
-
-        self.code_to_data[obj.code] = {
-            "obj": obj,
-            "index": index,
-        }
+            del self[self.index_of_code(obj.code)]
+        # Slice assignment shifts the tail with one memmove instead of
+        # list.insert's element-by-element loop; index semantics (negative,
+        # past-the-end) are identical
+        self.data[index:index] = (obj,)
+        self.code_to_data[obj.code] = obj
+        self._code_counts[obj.code] += 1
+        self._version += 1
 
     def __len__(self):
         return len(self.data)
@@ -125,80 +206,95 @@ class OptionList(collections.abc.MutableSequence):
 
     def __setitem__(self, key: int, value: Option):
         # Remove entry of option in current index
-        for opt in self.code_to_data.values():
-            if opt["index"] == key:
-                del self.code_to_data[opt["obj"].code]
-                break
+        old_code = self.data[key].code
+        self._code_counts[old_code] -= 1
+        if self._code_counts[old_code] <= 0:
+            del self._code_counts[old_code]
+            self.code_to_data.pop(old_code, None)
         # update self.data list with object
         self.data[key] = value
-        # reindex the object that is in the list
-        self.code_to_data[value.code] = {
-            "obj": value,
-            "index": key,
-        }
+        self.code_to_data[value.code] = value
+        self._code_counts[value.code] += 1
+        self._version += 1
+        # dedupe any other entry with the same code
         for index, opt in enumerate(self.data):
             if opt.code == value.code and index != key:
                 del self[index]
                 if index < key:
-                    self.code_to_data[value.code] = {
-                        "obj": value,
-                        "index": key,
-                    }
+                    self.code_to_data[value.code] = value
                     break
 
     def __delitem__(self, key: int):
-        code = self.data[key].code
-        # problematic cause it reindexes the whole list
-        for opt in self.code_to_data.values():
-            if opt["index"] > key:
-                opt["index"] -= 1
-        del self.code_to_data[code]
+        removed = self.data[key]
+        code = removed.code
         del self.data[key]
+        self._code_counts[code] -= 1
+        if self._code_counts[code] <= 0:
+            del self._code_counts[code]
+            self.code_to_data.pop(code, None)
+        elif self.code_to_data.get(code) is removed:
+            # A duplicate survives; re-point the index at it (rare path,
+            # only reachable for lists built with duplicate codes)
+            for opt in self.data:
+                if opt.code == code:
+                    self.code_to_data[code] = opt
+                    break
+        self._version += 1
 
     def __contains__(self, other):
         if hasattr(other, "asbytes"):
-            return other in self.data
+            # The code index answers most probes in O(1): an absent code
+            # means an absent option, and a matching entry means a hit.
+            # Only a present-but-different entry needs the list scan, since
+            # duplicate codes can coexist in lists built from raw data
+            indexed = self.code_to_data.get(other.code)
+            if indexed is None:
+                return False
+            return indexed == other or other in self.data
         return other in self.code_to_data
 
     def __eq__(self, other):
-        for self_item, other_item in zip(self, other):
-            if not (self_item == other_item):
-                return False
-        return True
+        other_data = other.data if isinstance(other, OptionList) else list(other)
+        return len(self.data) == len(other_data) and self.data == other_data
+
+    def _current_dict(self) -> dict:
+        # Single source of truth for the value dict; both as_dict and
+        # json refresh through here so the list is walked at most once
+        # per mutation
+        version, cached = self._dict_cache
+        if version != self._version:
+            cached = {}
+            for opt in self.data:
+                cached.update(opt.value)
+            self._dict_cache = (self._version, cached)
+        return cached
 
     def as_dict(self):
-        opt_dict = {}
-        for opt in self.data:
-            opt_dict.update(opt.value)
-        return opt_dict
+        # Hand out a copy so a caller mutating the result cannot poison
+        # the cache; copying is still far cheaper than re-walking values
+        return dict(self._current_dict())
 
     @property
     def json(self):
-        return json.dumps(self.as_dict(), indent=4)
+        version, cached = self._json_cache
+        if version != self._version:
+            # Serialize straight from the cache; json.dumps never mutates
+            # its input, so no defensive copy is needed here
+            cached = json.dumps(self._current_dict(), indent=4)
+            self._json_cache = (self._version, cached)
+        return cached
 
 
 class OptionDirectory(object):
     def __init__(self):
-        self.directory = {}
-        self.key_code_map = {}
-        temp = dict(globals())
-        for obj in temp:
-            try:
-                cls = globals()[obj]
-                code = cls.__dict__["code"]
-                key = cls.__dict__["key"]
-            except:
-                pass
-            else:
-                self.directory[code] = cls
-                self.key_code_map[key] = code
+        self.directory = _OPTION_REGISTRY
+        self.key_code_map = _KEY_CODE_MAP
 
     def value_to_code(self, value: dict) -> int:
-        code = self.key_code_map.get(list(value)[0])
-        return code
+        return _key_to_code(list(value)[0])
 
     def code_to_class(self, code: int) -> Option:
-        return self.directory.get(code, UnknownOption)
+        return _code_to_class(code)
 
     def value_to_bytes(self, value: dict):
         code = self.value_to_code(value)
@@ -215,36 +311,61 @@ class OptionDirectory(object):
         return cls.from_value({cls.key: short_value})
 
     def bytes_to_object(self, data: bytes):
-        if data[0] in [0, 255]:
-            code, length, data = (data[0], 0, b"")
-        else:
-            code, length, data = struct.unpack(f">BB{len(data) - 2}s", data)
-        return self.code_to_class(code)(code, length, data)
+        code = data[0]
+        if code == 0 or code == 255:
+            return _PAD_SINGLETON if code == 0 else _END_SINGLETON
+        return _parse_tlv(bytes(data))
 
 
 class Option(ABC):
-    # __slots__ = ("code", "key", "length", "data", "_value", "name", "description") # Probably dont need this right now
+
+    __slots__ = ("data", "_value")
     code: int = -1
     key = ""
+    name = "Unknown"
+    description = "Unknown"
+    # Subclasses with tiny fixed-width payloads decode eagerly at
+    # construction; the decode is cheaper than branching on every access
+    eager_value = False
+
+    def __init_subclass__(cls, **kwargs):
+        # Concrete subclasses declare their own code; generic bases and
+        # UnknownOption inherit the -1 sentinel and are skipped
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("code", -1) >= 0:
+            _OPTION_REGISTRY[cls.code] = cls
+            if cls.code < 256:
+                _CODE_TABLE[cls.code] = cls
+            _KEY_CODE_MAP[cls.key] = cls.code
+            cls.name = OPTIONS.get(cls.code, {}).get("name", "Unknown")
+            cls.description = OPTIONS.get(cls.code, {}).get("description", "Unknown")
 
     def __init__(self, code: int, length: int, data: bytes) -> None:
-        global OPTIONS
         # Option code, single byte, values from 0 to 255 are valid
         if code != self.code:
             raise DHCPValueError(f"Option code does not match {code} != {self.code}")
-        self.length = (
-            length  # Option size (# of bytes), options 0 and 255 are fixed size (0)
-        )
+        # length is accepted for call-site compatibility but not stored;
+        # it is always derivable from the payload
         self.data = data  # Option data in bytes
         self._value: Optional[dict] = None
-        self.name = OPTIONS.get(self.code, {}).get("name", "Unknown")
-        self.description = OPTIONS.get(self.code, {}).get("description", "Unknown")
+        if self.eager_value:
+            self._value = self.value
 
     def __repr__(self):
         return f"{self.__class__.__name__}(code={self.code}, length={self.length}, data={self.data})"
 
     def __eq__(self, other):
-        return self.asbytes == other.asbytes
+        return self.code == other.code and self.data == other.data
+
+    @property
+    def length(self) -> int:
+        """
+        Option size (# of bytes), options 0 and 255 are fixed size (0)
+        """
+        return len(self.data)
+
+    def __hash__(self):
+        return hash((self.code, self.data))
 
     @property
     @abstractmethod
@@ -266,137 +387,168 @@ class Option(ABC):
         """
         Wireformat for option including code and length
         """
-        return struct.pack(">BB", self.code, self.length) + self.data
+        out = bytearray(2 + len(self.data))
+        out[0] = self.code
+        out[1] = self.length
+        out[2:] = self.data
+        return bytes(out)
+
+    def write_into(self, buf: bytearray, offset: int = 0) -> int:
+        """
+        Writes the wireformat for this option into buf starting at offset
+        and returns the offset just past the written bytes, so a caller
+        can serialize a whole option list into one preallocated buffer.
+        """
+        end = offset + 2 + len(self.data)
+        buf[offset] = self.code
+        buf[offset + 1] = self.length
+        buf[offset + 2 : end] = self.data
+        return end
+
+    def write_to(self, buf: bytearray) -> None:
+        """
+        Appends the wireformat for this option to buf. The growable
+        counterpart to write_into for callers building a packet of
+        unknown final size.
+        """
+        buf.append(self.code)
+        buf.append(len(self.data))
+        buf += self.data
 
     def data2IParray(self) -> List[str]:
         """
         It is common to see lists of IP addrs as option values. This returns a
         list of IPs from the options data.
         """
-        num_addrs = len(self.data) // 4
         return [
-            str(ipaddress.IPv4Address(ip))
-            for ip in struct.unpack(">" + "L" * num_addrs, self.data)
+            socket.inet_ntoa(self.data[i : i + 4])
+            for i in range(0, len(self.data), 4)
         ]
 
     def data2string(self) -> str:
         """
         Converts a data field to a string.
         """
-        return struct.unpack(f">{len(self.data)}s", self.data)[0].decode().strip()
+        return self.data.decode().strip()
 
     def data2bool(self) -> bool:
         """
         Converts data to bool value.
         """
-        return struct.unpack(">?", self.data)[0]
+        return self.data[0] != 0
 
     def data2bin(self) -> str:
         """
         Converts data to a string representation of the binary data
         """
-        return " ".join([f"0x{d:02X}" for d in self.data])
+        return " ".join([_HEX[d] for d in self.data])
 
     def data2IPpairs(self) -> List[Tuple[str, str]]:
         """
         Converts data to tuples of IP pairs.
         """
-        num_pairs = len(self.data) // 8
-        pairs: List[Tuple[str, str]] = []
-        for i in range(num_pairs):
-            ip1, ip2 = [
-                str(ipaddress.IPv4Address(ip))
-                for ip in struct.unpack(">LL", self.data[i * 8 : (i + 1) * 8])
-            ]
-            pairs.append((ip1, ip2))
-        return pairs
+        ips = self.data2IParray()
+        return list(zip(ips[0::2], ips[1::2]))
 
     def data2uint8(self) -> int:
         """
         Converts data to unsigned 8 bit integer.
         """
-        return struct.unpack(">B", self.data)[0]
+        return self.data[0]
 
     def data2uint16(self) -> int:
         """
         Converts data to unsigned 16 bit integer.
         """
-        return struct.unpack(">H", self.data)[0]
+        return _U16(self.data)[0]
 
     def data2uint32(self) -> int:
         """
         Converts data to unsigned 32 bit integer.
         """
-        return struct.unpack(">L", self.data)[0]
+        return _U32(self.data)[0]
 
     def data2int32(self) -> int:
         """
         Converts data to signed 32 bit integer.
         """
-        return struct.unpack(">l", self.data)[0]
+        return _I32(self.data)[0]
 
     def data2uint8array(self) -> List[int]:
         """
         Converts data to list of unsigned 8 bit integers.
         """
-        return list(struct.unpack(">" + "B" * len(self.data), self.data))
+        # list() over bytes is a straight C loop, no format parse needed
+        return list(self.data)
 
     def data2uint16array(self) -> List[int]:
         """
         Converts data to list of unsigned 16 bit integers.
         """
-        return list(struct.unpack(">" + "H" * (len(self.data) // 2), self.data))
+        if _np is not None and len(self.data) >= 32:
+            return _np.frombuffer(self.data, dtype=">u2").tolist()
+        # array.frombytes + byteswap + tolist stays in C end to end and
+        # beats a struct unpack-then-listify at every array size
+        arr = array.array("H")
+        arr.frombytes(self.data)
+        if sys.byteorder == "little":
+            arr.byteswap()
+        return arr.tolist()
 
     @staticmethod
     def IParray2data(value: List[str]) -> bytes:
         """
         Converts list of IP addresses to bytes
         """
-        return b"".join([ipaddress.IPv4Address(ip).packed for ip in value])
+        return b"".join([socket.inet_aton(ip) for ip in value])
 
     @staticmethod
     def int32array2data(value: List[int]) -> bytes:
         """
         Converts list of int32s to bytes
         """
-        return struct.pack(">" + "l" * len(value), *value)
+        return _cached_struct(f">{len(value)}l").pack(*value)
 
     @staticmethod
     def uint8array2data(value: List[int]) -> bytes:
         """
         Converts list of uint8s to bytes
         """
-        return struct.pack(">" + "B" * len(value), *value)
+        # bytes() validates the 0-255 range and copies in one C call
+        return bytes(value)
 
     @staticmethod
     def uint16array2data(value: List[int]) -> bytes:
         """
         Converts list of uint16s to bytes
         """
-        return struct.pack(">" + "H" * len(value), *value)
+        return _cached_struct(f">{len(value)}H").pack(*value)
 
     @staticmethod
     def uint32array2data(value: List[int]) -> bytes:
         """
         Converts list of uint32s to bytes
         """
-        return struct.pack(">" + "L" * len(value), *value)
+        return _cached_struct(f">{len(value)}L").pack(*value)
 
     @staticmethod
     def bool2data(value: bool) -> bytes:
         """
         Converts bool to bytes
         """
-        return struct.pack(">?", value)
+        return b"\x01" if value else b"\x00"
 
     @staticmethod
     def bin2data(value: str) -> bytes:
         """
         Converts string representing binary data to bytes
         """
-        return struct.pack(
-            ">" + "B" * len(value.split()), *[int(val[2:], 16) for val in value.split()]
-        )
+        try:
+            # One C call; fromhex skips the spaces between tokens itself
+            return bytes.fromhex(value.replace("0x", ""))
+        except ValueError:
+            # Unpadded tokens like "0x1" fall back to a real parse
+            return bytes([int(val, 16) for val in value.split()])
 
 
 class BinOption(Option):
@@ -404,11 +556,11 @@ class BinOption(Option):
     Generic implementation of binary option
     """
 
-    @property
+    __slots__ = ()
+
+    @_cached_value
     def value(self) -> Dict[str, str]:
-        if self._value is None:
-            self._value = {self.key: self.data2bin()}
-        return self._value
+        return {self.key: self.data2bin()}
 
     @classmethod
     def from_value(cls, value: Dict[str, str]):
@@ -428,11 +580,13 @@ class BoolOption(Option):
     Generic implementation of boolean option
     """
 
-    @property
+    __slots__ = ()
+
+    eager_value = True
+
+    @_cached_value
     def value(self) -> Dict[str, bool]:
-        if self._value is None:
-            self._value = {self.key: self.data2bool()}
-        return self._value
+        return {self.key: self.data2bool()}
 
     @classmethod
     def from_value(cls, value: Dict[str, bool]):
@@ -445,11 +599,11 @@ class StrOption(Option):
     Generic implementation of string option
     """
 
-    @property
+    __slots__ = ()
+
+    @_cached_value
     def value(self) -> Dict[str, str]:
-        if self._value is None:
-            self._value = {self.key: self.data2string()}
-        return self._value
+        return {self.key: self.data2string()}
 
     @classmethod
     def from_value(cls, value: Dict[str, str]):
@@ -462,11 +616,13 @@ class IPOption(Option):
     Generic implementation of an IP option
     """
 
-    @property
+    __slots__ = ()
+
+    eager_value = True
+
+    @_cached_value
     def value(self) -> Dict[str, str]:
-        if self._value is None:
-            self._value = {self.key: self.data2IParray()[0]}
-        return self._value
+        return {self.key: self.data2IParray()[0]}
 
     @classmethod
     def from_value(cls, value: Dict[str, str]):
@@ -479,11 +635,11 @@ class IPArrayOption(Option):
     Generic implementation of an IP array
     """
 
-    @property
+    __slots__ = ()
+
+    @_cached_value
     def value(self) -> Dict[str, List[str]]:
-        if self._value is None:
-            self._value = {self.key: self.data2IParray()}
-        return self._value
+        return {self.key: self.data2IParray()}
 
     @classmethod
     def from_value(cls, value: Dict[str, List[str]]):
@@ -496,15 +652,17 @@ class uint8Option(Option):
     Generic implementation of an uint8 option
     """
 
-    @property
+    __slots__ = ()
+
+    eager_value = True
+
+    @_cached_value
     def value(self) -> Dict[str, int]:
-        if self._value is None:
-            self._value = {self.key: self.data2uint8()}
-        return self._value
+        return {self.key: self.data2uint8()}
 
     @classmethod
     def from_value(cls, value: Dict[str, int]):
-        data = cls.uint8array2data([value[cls.key]])
+        data = bytes((value[cls.key],))
         return cls(cls.code, len(data), data)
 
 
@@ -513,15 +671,17 @@ class uint16Option(Option):
     Generic implementation of an uint16 option
     """
 
-    @property
+    __slots__ = ()
+
+    eager_value = True
+
+    @_cached_value
     def value(self) -> Dict[str, int]:
-        if self._value is None:
-            self._value = {self.key: self.data2uint16()}
-        return self._value
+        return {self.key: self.data2uint16()}
 
     @classmethod
     def from_value(cls, value: Dict[str, int]):
-        data = cls.uint16array2data([value[cls.key]])
+        data = _P16(value[cls.key])
         return cls(cls.code, len(data), data)
 
 
@@ -530,15 +690,17 @@ class uint32Option(Option):
     Generic implementation of an uint32 option
     """
 
-    @property
+    __slots__ = ()
+
+    eager_value = True
+
+    @_cached_value
     def value(self) -> Dict[str, int]:
-        if self._value is None:
-            self._value = {self.key: self.data2uint32()}
-        return self._value
+        return {self.key: self.data2uint32()}
 
     @classmethod
     def from_value(cls, value: Dict[str, int]):
-        data = cls.uint32array2data([value[cls.key]])
+        data = _P32(value[cls.key])
         return cls(cls.code, len(data), data)
 
 
@@ -547,11 +709,11 @@ class uint8ArrayOption(Option):
     Generic implementation of an uint8 array option
     """
 
-    @property
+    __slots__ = ()
+
+    @_cached_value
     def value(self) -> Dict[str, List[int]]:
-        if self._value is None:
-            self._value = {self.key: self.data2uint8array()}
-        return self._value
+        return {self.key: self.data2uint8array()}
 
     @classmethod
     def from_value(cls, value: Dict[str, List[int]]):
@@ -564,11 +726,11 @@ class uint16ArrayOption(Option):
     Generic implementation of an uint16 array option
     """
 
-    @property
+    __slots__ = ()
+
+    @_cached_value
     def value(self) -> Dict[str, List[int]]:
-        if self._value is None:
-            self._value = {self.key: self.data2uint16array()}
-        return self._value
+        return {self.key: self.data2uint16array()}
 
     @classmethod
     def from_value(cls, value: Dict[str, List[int]]):
@@ -581,15 +743,17 @@ class int32Option(Option):
     Generic implementation of an int32 option
     """
 
-    @property
+    __slots__ = ()
+
+    eager_value = True
+
+    @_cached_value
     def value(self) -> Dict[str, int]:
-        if self._value is None:
-            self._value = {self.key: self.data2int32()}
-        return self._value
+        return {self.key: self.data2int32()}
 
     @classmethod
     def from_value(cls, value: Dict[str, int]):
-        data = cls.int32array2data([value[cls.key]])
+        data = _PI32(value[cls.key])
         return cls(cls.code, len(data), data)
 
 
@@ -601,6 +765,8 @@ class Pad(Option):
     boundaries.
     """
 
+    __slots__ = ()
+
     code = 0
     key = "pad_option"
 
@@ -616,6 +782,13 @@ class Pad(Option):
     def asbytes(self) -> bytes:
         return b"\x00"
 
+    def write_into(self, buf: bytearray, offset: int = 0) -> int:
+        buf[offset] = 0
+        return offset + 1
+
+    def write_to(self, buf: bytearray) -> None:
+        buf.append(0)
+
 
 class End(Option):
     """
@@ -624,6 +797,8 @@ class End(Option):
     End
     """
 
+    __slots__ = ()
+
     code = 255
     key = "end_option"
 
@@ -639,6 +814,19 @@ class End(Option):
     def asbytes(self):
         return b"\xff"
 
+    def write_into(self, buf: bytearray, offset: int = 0) -> int:
+        buf[offset] = 255
+        return offset + 1
+
+    def write_to(self, buf: bytearray) -> None:
+        buf.append(255)
+
+
+# Pad and End carry no payload and options are immutable, so a single
+# shared instance of each can serve every parse
+_PAD_SINGLETON = Pad(0, 0, b"")
+_END_SINGLETON = End(255, 0, b"")
+
 
 class SubnetMask(IPOption):
     """
@@ -652,6 +840,8 @@ class SubnetMask(IPOption):
     Option value defined as {"subnet_mask": '255.255.255.0'}
     """
 
+    __slots__ = ()
+
     code = 1
     key = "subnet_mask"
 
@@ -667,6 +857,8 @@ class TimeOffset(int32Option):
     Option value defined as {"time_offset_s": 3600, "time_offset_h": 1]}
     """
 
+    __slots__ = ()
+
     code = 2
     key = "time_offset_s"
 
@@ -684,6 +876,8 @@ class Router(IPArrayOption):
     Option value defined as {"routers": ['1.1.1.1', '2.2.2.2']}
     """
 
+    __slots__ = ()
+
     code = 3
     key = "routers"
 
@@ -701,6 +895,8 @@ class TimeServer(IPArrayOption):
     Option value defined as {"time_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 4
     key = "time_servers"
 
@@ -716,6 +912,8 @@ class NameServer(IPArrayOption):
     Option value defined as {"name_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 5
     key = "name_servers"
 
@@ -732,6 +930,8 @@ class DNSServer(IPArrayOption):
     Option value defined as {"dns_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 6
     key = "dns_servers"
 
@@ -747,6 +947,8 @@ class LogServer(IPArrayOption):
     Option value defined as {"log_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 7
     key = "log_servers"
 
@@ -761,6 +963,8 @@ class CookieServer(IPArrayOption):
     Option value defined as {"cookie_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 8
     key = "cookie_servers"
 
@@ -775,6 +979,8 @@ class LPRServer(IPArrayOption):
     Option value defined as {"lpr_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 9
     key = "lpr_servers"
 
@@ -789,6 +995,8 @@ class ImpressServer(IPArrayOption):
     Option value defined as {"impress_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 10
     key = "impress_servers"
 
@@ -803,6 +1011,8 @@ class ResourceLocationServer(IPArrayOption):
     Option value defined as {"resource_location_servers": ['1.1.1.1', ...]}
     """
 
+    __slots__ = ()
+
     code = 11
     key = "resource_location_servers"
 
@@ -819,6 +1029,8 @@ class Hostname(StrOption):
     Option value defined as {"hostname": "laptop01"}
     """
 
+    __slots__ = ()
+
     code = 12
     key = "hostname"
 
@@ -834,6 +1046,8 @@ class BootfileSize(uint16Option):
     Option value defined as {"bootfile_size": 256}
     """
 
+    __slots__ = ()
+
     code = 13
     key = "bootfile_size"
 
@@ -849,6 +1063,8 @@ class MeritDumpFile(StrOption):
     Option value defined as {"merit_dump_file": "something"}
     """
 
+    __slots__ = ()
+
     code = 14
     key = "merit_dump_file"
 
@@ -864,6 +1080,8 @@ class DomainName(StrOption):
     Option value defined as {"domain_name": "google.com"}
     """
 
+    __slots__ = ()
+
     code = 15
     key = "domain_name"
 
@@ -878,6 +1096,8 @@ class SwapServer(IPOption):
     Option value defined as {"swap_server": "1.1.1.1"}
     """
 
+    __slots__ = ()
+
     code = 16
     key = "swap_server"
 
@@ -892,6 +1112,8 @@ class RootPath(StrOption):
     Option value defined as {"root_path": "something"}
     """
 
+    __slots__ = ()
+
     code = 17
     key = "root_path"
 
@@ -907,6 +1129,8 @@ class ExtensionPath(StrOption):
     Option value defined as {"extensions_path": "something"}
     """
 
+    __slots__ = ()
+
     code = 18
     key = "extensions_path"
 
@@ -921,6 +1145,8 @@ class IPForwarding(BoolOption):
     Option value defined as {"ip_forwarding": True}
     """
 
+    __slots__ = ()
+
     code = 19
     key = "ip_forwarding"
 
@@ -935,6 +1161,8 @@ class NonLocalSourceRouting(BoolOption):
     Option value defined as {"non_local_source_routing": True}
     """
 
+    __slots__ = ()
+
     code = 20
     key = "non_local_source_routing"
 
@@ -953,25 +1181,25 @@ class PolicyFilter(Option):
     }
     """
 
+    __slots__ = ()
+
     code = 21
     key = "policy_filters"
 
-    @property
+    @_cached_value
     def value(self) -> Dict[str, List[Dict[str, str]]]:
-        if self._value is None:
-            self._value = {
-                self.key: [
-                    {"address": pair[0], "mask": pair[1]}
-                    for pair in self.data2IPpairs()
-                ]
-            }
-        return self._value
+        return {
+            self.key: [
+                {"address": pair[0], "mask": pair[1]}
+                for pair in self.data2IPpairs()
+            ]
+        }
 
     @classmethod
     def from_value(cls, value: Dict[str, List[Dict[str, str]]]):
-        ip_array: List[str] = []
-        for pair in value[cls.key]:
-            ip_array.extend(pair.values())
+        ip_array = list(
+            itertools.chain.from_iterable(pair.values() for pair in value[cls.key])
+        )
         data = cls.IParray2data(ip_array)
         return cls(cls.code, len(data), data)
 
@@ -986,6 +1214,8 @@ class MaxDGRAMReassemblySize(uint16Option):
     Option value defined as {"max_datagram_reassembly_size": 512}
     """
 
+    __slots__ = ()
+
     code = 22
     key = "max_datagram_reassembly_size"
 
@@ -1000,6 +1230,8 @@ class IPTTL(uint8Option):
     Object value is defined as: {"default_ip_ttl": 123}
     """
 
+    __slots__ = ()
+
     code = 23
     key = "default_ip_ttl"
 
@@ -1015,6 +1247,8 @@ class PathMTUAgingTimeout(uint32Option):
     Object value is defined as: {"path_MTU_aging_timeout":1234}
     """
 
+    __slots__ = ()
+
     code = 24
     key = "path_MTU_aging_timeout"
 
@@ -1029,6 +1263,8 @@ class PathMTUAgingTable(uint16ArrayOption):
     Object value defined as: {"path_mtu_aging_table": [123, 234, ...]}
     """
 
+    __slots__ = ()
+
     code = 25
     key = "path_mtu_aging_table"
 
@@ -1041,6 +1277,8 @@ class InterfaceMTU(uint16Option):
     Object value defined as: {"interface_mtu": 1234}
     """
 
+    __slots__ = ()
+
     code = 26
     key = "interface_mtu"
 
@@ -1056,6 +1294,8 @@ class AllSubnetsLocal(BoolOption):
     Option value defined as: {"all_subnets_local": True}
     """
 
+    __slots__ = ()
+
     code = 27
     key = "all_subnets_local"
 
@@ -1069,6 +1309,8 @@ class BroadcastAddress(IPOption):
     Objected defined as: {"broadcast_address": "1.1.1.1"}
     """
 
+    __slots__ = ()
+
     code = 28
     key = "broadcast_address"
 
@@ -1083,6 +1325,8 @@ class PerformMaskDiscovery(BoolOption):
     Object value defined as: {"perform_mask_discovery"}
     """
 
+    __slots__ = ()
+
     code = 29
     key = "perform_mask_discovery"
 
@@ -1097,6 +1341,8 @@ class MaskSupplier(BoolOption):
     Object defined as: {"mask_supplier": True}
     """
 
+    __slots__ = ()
+
     code = 30
     key = "mask_supplier"
 
@@ -1111,6 +1357,8 @@ class PerformRouterDiscovery(BoolOption):
     Object defined as: {"perform_router_discovery": True}
     """
 
+    __slots__ = ()
+
     code = 31
     key = "perform_router_discovery"
 
@@ -1125,6 +1373,8 @@ class RouterSolicitationAddress(IPOption):
     Option value defined as: {"router_solicitation_address": "1.1.1.1"}
     """
 
+    __slots__ = ()
+
     code = 32
     key = "router_solicitation_address"
 
@@ -1138,25 +1388,25 @@ class StaticRoute(Option):
     they are listed in descending order of priority.
     """
 
+    __slots__ = ()
+
     code = 33
     key = "static_routes"
 
-    @property
+    @_cached_value
     def value(self) -> Dict[str, List[Dict[str, str]]]:
-        if self._value is None:
-            self._value = {
-                self.key: [
-                    {"destination": pair[0], "router": pair[1]}
-                    for pair in self.data2IPpairs()
-                ]
-            }
-        return self._value
+        return {
+            self.key: [
+                {"destination": pair[0], "router": pair[1]}
+                for pair in self.data2IPpairs()
+            ]
+        }
 
     @classmethod
     def from_value(cls, value: Dict[str, List[Dict[str, str]]]):
-        ip_array: List[str] = []
-        for pair in value[cls.key]:
-            ip_array.extend(pair.values())
+        ip_array = list(
+            itertools.chain.from_iterable(pair.values() for pair in value[cls.key])
+        )
         data = cls.IParray2data(ip_array)
         return cls(cls.code, len(data), data)
 
@@ -1171,6 +1421,8 @@ class TrailerEncapsulation(BoolOption):
     Option value defined as: {"trailer_encapsulation": True}
     """
 
+    __slots__ = ()
+
     code = 34
     key = "trailer_encapsulation"
 
@@ -1184,6 +1436,8 @@ class ARPCacheTimeout(uint32Option):
     Option value defined as: {"arp_cache_timeout": 123}
     """
 
+    __slots__ = ()
+
     code = 35
     key = "arp_cache_timeout"
 
@@ -1199,6 +1453,8 @@ class EthernetEncapsulation(BoolOption):
     Option value defined as: {"ethernet_encapsulation": True}
     """
 
+    __slots__ = ()
+
     code = 36
     key = "ethernet_encapsulation"
 
@@ -1213,6 +1469,8 @@ class TCPDefaultTTL(uint8Option):
     Option value defined as: {"tcp_default_ttl": 123}
     """
 
+    __slots__ = ()
+
     code = 37
     key = "tcp_default_ttl"
 
@@ -1227,6 +1485,8 @@ class TCPKeepaliveInterval(uint32Option):
     Option value defined as: {"tcp_keepalive_interval": 123}
     """
 
+    __slots__ = ()
+
     code = 38
     key = "tcp_keepalive_interval"
 
@@ -1242,6 +1502,8 @@ class TCPKeepaliveGarbage(BoolOption):
     Option value defined as: {"tcp_keepalive_garbage": True}
     """
 
+    __slots__ = ()
+
     code = 39
     key = "tcp_keepalive_garbage"
 
@@ -1255,6 +1517,8 @@ class NISDomain(StrOption):
     Option value defined as: {"network_information_service_domain": "google.com"}
     """
 
+    __slots__ = ()
+
     code = 40
     key = "network_information_service_domain"
 
@@ -1269,6 +1533,8 @@ class NISServer(IPArrayOption):
     Option value defined as: {"network_information_servers": ["1.1.1.1", "2.2.2.2"]}
     """
 
+    __slots__ = ()
+
     code = 41
     key = "network_information_servers"
 
@@ -1283,6 +1549,8 @@ class NTPServers(IPArrayOption):
     Option value defined as: {"ntp_servers": ["1.1.1.1", "2.2.2.2"]}
     """
 
+    __slots__ = ()
+
     code = 42
     key = "ntp_servers"
 
@@ -1297,6 +1565,8 @@ class VendorSpecificInformation(BinOption):
     Option value defined as: {"vender_specific_information": "0x0b 0x1c ..."}
     """
 
+    __slots__ = ()
+
     code = 43
     key = "vendor_specific_information"
 
@@ -1311,6 +1581,8 @@ class NetbiosNameServer(IPArrayOption):
     Option value defined as: {"netbios_name_servers": ["1.1.1.1", "2.2.2.2"]}
     """
 
+    __slots__ = ()
+
     code = 44
     key = "netbios_name_servers"
 
@@ -1325,6 +1597,8 @@ class NetbiosDatagramDistributionServer(IPArrayOption):
     Option value defined as: {"netbios_datagram_distribution_server": ["1.1.1.1", "2.2.2.2"]}
     """
 
+    __slots__ = ()
+
     code = 45
     key = "netbios_datagram_distribution_server"
 
@@ -1339,28 +1613,24 @@ class NetbiosNodeType(Option):
     Option value defined as: {"netbios_node_type": "B-node"}
     """
 
+    __slots__ = ()
+
     code = 46
     key = "netbios_node_type"
 
-    @property
+    # Forward and reverse tables built once at class definition; decode is
+    # keyed on the raw payload bytes so no integer conversion is needed
+    _DECODE = {b"\x01": "B-node", b"\x02": "P-node", b"\x04": "M-node", b"\x08": "H-node"}
+    _ENCODE = {name: data for data, name in _DECODE.items()}
+
+    @_cached_value
     def value(self) -> Dict[str, str]:
-        if self._value is None:
-            self._value = {
-                self.key: {0x1: "B-node", 0x2: "P-node", 0x4: "M-node", 0x8: "H-node"}[
-                    int.from_bytes(self.data, "big")
-                ]
-            }
-        return self._value
+        return {self.key: self._DECODE[self.data]}
 
     @classmethod
     def from_value(cls, value: Dict[str, str]):
-        data = {
-            "B-node": b"\x01",
-            "P-node": b"\x02",
-            "M-node": b"\x04",
-            "H-node": b"\x08",
-        }[value[cls.key]]
-        return cls(cls.code, len(data), data)
+        # enum payloads are always a single byte
+        return cls(cls.code, 1, cls._ENCODE[value[cls.key]])
 
 
 class NetbiosScope(StrOption):
@@ -1373,6 +1643,8 @@ class NetbiosScope(StrOption):
     Option value defined as: {"netbios_scope": "something"}
     """
 
+    __slots__ = ()
+
     code = 47
     key = "netbios_scope"
 
@@ -1387,6 +1659,8 @@ class NetbiosXWindowSystemFontServer(IPArrayOption):
     Option value defined as: {"netbios_x_window_system_font_servers": ["1.1.1.1", "2.2.2.2"]}
     """
 
+    __slots__ = ()
+
     code = 48
     key = "netbios_x_window_system_font_servers"
 
@@ -1401,6 +1675,8 @@ class XWindowSystemDisplayManager(IPArrayOption):
     Option value is defined as: {"x_window_system_display_manager": ["1.1.1.1", "2.2.2.2"]}
     """
 
+    __slots__ = ()
+
     code = 49
     key = "x_window_system_display_manager"
 
@@ -1415,6 +1691,8 @@ class RequestedIPAddress(IPOption):
     Option value is defined as: {"requested_ip_address": "1.1.1.1"} 
     """
 
+    __slots__ = ()
+
     code = 50
     key = "requested_ip_address"
 
@@ -1429,6 +1707,8 @@ class IPAddressLeaseTime(uint32Option):
     lease time it is willing to offer.
     """
 
+    __slots__ = ()
+
     code = 51
     key = "lease_time"
 
@@ -1443,29 +1723,26 @@ class Overload(Option):
     space allotted for options.
     """
 
+    __slots__ = ()
+
     code = 52
     key = "option_overload"
 
-    @property
+    _DECODE = {
+        b"\x01": "'file' field is used to hold options",
+        b"\x02": "'sname' field is used to hold options",
+        b"\x03": "both fields are used to hold options",
+    }
+    _ENCODE = {name: data for data, name in _DECODE.items()}
+
+    @_cached_value
     def value(self) -> Dict[str, str]:
-        if self._value is None:
-            self._value = {
-                self.key: {
-                    1: "'file' field is used to hold options",
-                    2: "'sname' field is used to hold options",
-                    3: "both fields are used to hold options",
-                }[int.from_bytes(self.data, "big")]
-            }
-        return self._value
+        return {self.key: self._DECODE[self.data]}
 
     @classmethod
     def from_value(cls, value: Dict[str, str]):
-        data = {
-            "'file' field is used to hold options": b"\x01",
-            "'sname' field is used to hold options": b"\x02",
-            "both fields are used to hold options": b"\x03",
-        }[value[cls.key]]
-        return cls(cls.code, len(data), data)
+        # enum payloads are always a single byte
+        return cls(cls.code, 1, cls._ENCODE[value[cls.key]])
 
 
 class MessageType(Option):
@@ -1475,39 +1752,34 @@ class MessageType(Option):
     This option is used to convey the type of the DHCP message.
     """
 
+    __slots__ = ()
+
     code = 53
     key = "dhcp_message_type"
 
-    @property
+    # Message types are dense small integers, so decode indexes a tuple by
+    # the single payload byte; slot 0 is unused
+    _DECODE = (
+        None,
+        "DHCPDISCOVER",
+        "DHCPOFFER",
+        "DHCPREQUEST",
+        "DHCPDECLINE",
+        "DHCPACK",
+        "DHCPNAK",
+        "DHCPRELEASE",
+        "DHCPINFORM",
+    )
+    _ENCODE = {name: bytes((i,)) for i, name in enumerate(_DECODE) if name}
+
+    @_cached_value
     def value(self) -> Dict[str, str]:
-        if self._value is None:
-            self._value = {
-                self.key: {
-                    1: "DHCPDISCOVER",
-                    2: "DHCPOFFER",
-                    3: "DHCPREQUEST",
-                    4: "DHCPDECLINE",
-                    5: "DHCPACK",
-                    6: "DHCPNAK",
-                    7: "DHCPRELEASE",
-                    8: "DHCPINFORM",
-                }[int.from_bytes(self.data, "big")]
-            }
-        return self._value
+        return {self.key: self._DECODE[self.data[0]]}
 
     @classmethod
     def from_value(cls, value: Dict[str, str]):
-        data = {
-            "DHCPDISCOVER": b"\x01",
-            "DHCPOFFER": b"\x02",
-            "DHCPREQUEST": b"\x03",
-            "DHCPDECLINE": b"\x04",
-            "DHCPACK": b"\x05",
-            "DHCPNAK": b"\x06",
-            "DHCPRELEASE": b"\x07",
-            "DHCPINFORM": b"\x08",
-        }[value[cls.key]]
-        return cls(cls.code, len(data), data)
+        # enum payloads are always a single byte
+        return cls(cls.code, 1, cls._ENCODE[value[cls.key]])
 
 
 class ServerIdentifier(IPOption):
@@ -1518,6 +1790,8 @@ class ServerIdentifier(IPOption):
     optionally be included in the DHCPACK and DHCPNAK messages.
     """
 
+    __slots__ = ()
+
     code = 54
     key = "dhcp_server"
 
@@ -1532,6 +1806,8 @@ class ParameterRequestList(uint8ArrayOption):
     as defined in this document.
     """
 
+    __slots__ = ()
+
     code = 55
     key = "parameter_request_list"
 
@@ -1546,6 +1822,8 @@ class Message(StrOption):
     client declined the offered parameters.
     """
 
+    __slots__ = ()
+
     code = 56
     key = "message"
 
@@ -1558,6 +1836,8 @@ class MaxDHCPMessageSize(uint16Option):
     willing to accept.
     """
 
+    __slots__ = ()
+
     code = 57
     key = "max_dhcp_message_size"
 
@@ -1570,6 +1850,8 @@ class RenewalTime(uint32Option):
     the client transitions to the RENEWING state.
     """
 
+    __slots__ = ()
+
     code = 58
     key = "renewal_time"
 
@@ -1582,6 +1864,8 @@ class RebindingTime(uint32Option):
     the client transitions to the REBINDING state.
     """
 
+    __slots__ = ()
+
     code = 59
     key = "rebinding_time"
 
@@ -1594,6 +1878,8 @@ class VendorClassIdentifier(StrOption):
     type and configuration of a DHCP client.
     """
 
+    __slots__ = ()
+
     code = 60
     key = "vendor_class_identifier"
 
@@ -1608,28 +1894,25 @@ class ClientIdentifier(Option):
     clients in an administrative domain.
     """
 
+    __slots__ = ()
+
     code = 61
     key = "client_identifier"
 
-    @property
+    @_cached_value
     def value(self) -> Dict[str, Dict[str, str]]:
-        if self._value is None:
-            hwtype, hwaddr = struct.unpack(">B6s", self.data)
-            self._value = {
-                self.key: {
-                    "hwtype": hwtype,
-                    "hwaddr": ":".join([f"{b:02X}" for b in hwaddr]),
-                }
+        return {
+            self.key: {
+                "hwtype": self.data[0],
+                "hwaddr": self.data[1:].hex(":").upper(),
             }
-        return self._value
+        }
 
     @classmethod
     def from_value(cls, value):
         hwtype = value[cls.key]["hwtype"]
         hwaddr = value[cls.key]["hwaddr"]
-        data = struct.pack(">B", hwtype) + struct.pack(
-            ">" + "B" * len(hwaddr.split(":")), *[int(i, 16) for i in hwaddr.split(":")]
-        )
+        data = bytes([hwtype]) + bytes.fromhex(hwaddr.replace(":", ""))
         return cls(cls.code, len(data), data)
 
 
@@ -1640,6 +1923,8 @@ class NISPlusDomain(StrOption):
     Specifies the name of the client's NIS+ [17] domain.
     """
 
+    __slots__ = ()
+
     code = 64
     key = "nis_plus_domain"
 
@@ -1652,6 +1937,8 @@ class NISPlusServers(IPArrayOption):
     the client.
     """
 
+    __slots__ = ()
+
     code = 65
     key = "nis_plus_servers"
 
@@ -1664,6 +1951,8 @@ class TFTPServerName(StrOption):
     the DHCP header has been used for DHCP options.
     """
 
+    __slots__ = ()
+
     code = 66
     key = "tftp_server_name"
 
@@ -1676,6 +1965,8 @@ class BootfileName(StrOption):
     DHCP header has been used for DHCP options.
     """
 
+    __slots__ = ()
+
     code = 67
     key = "bootfile_name"
 
@@ -1688,6 +1979,8 @@ class MobileIPHomeAgent(IPArrayOption):
     available to the client.
     """
 
+    __slots__ = ()
+
     code = 68
     key = "mobile_ip_home_agent"
 
@@ -1699,6 +1992,8 @@ class SMTPServer(IPArrayOption):
     Specifies a list of SMTP servers available to the client.
     """
 
+    __slots__ = ()
+
     code = 69
     key = "smtp_servers"
 
@@ -1710,6 +2005,8 @@ class POP3Server(IPArrayOption):
     Specifies a list of POP3 available to the client.
     """
 
+    __slots__ = ()
+
     code = 70
     key = "pop3_servers"
 
@@ -1721,6 +2018,8 @@ class NNTPServer(IPArrayOption):
     Specifies a list of NNTP available to the client.
     """
 
+    __slots__ = ()
+
     code = 71
     key = "nntp_servers"
 
@@ -1732,6 +2031,8 @@ class WWWServer(IPArrayOption):
     Specifies a list of WWW available to the client.
     """
 
+    __slots__ = ()
+
     code = 72
     key = "world_wide_web_servers"
 
@@ -1743,6 +2044,8 @@ class FingerServer(IPArrayOption):
     Specifies a list of Finger available to the client.
     """
 
+    __slots__ = ()
+
     code = 73
     key = "finger_servers"
 
@@ -1754,6 +2057,8 @@ class IRCServer(IPArrayOption):
     Specifies a list of IRC available to the client.
     """
 
+    __slots__ = ()
+
     code = 74
     key = "irc_servers"
 
@@ -1765,6 +2070,8 @@ class StreetTalkServer(IPArrayOption):
     Specifies a list of StreetTalk servers available to the client.
     """
 
+    __slots__ = ()
+
     code = 75
     key = "streettalk_servers"
 
@@ -1776,6 +2083,8 @@ class StreetTalkDirectoryAssistanceServer(IPArrayOption):
     Specifies a list of STDA servers available to the client.
     """
 
+    __slots__ = ()
+
     code = 76
     key = "stda_servers"
 
@@ -1787,6 +2096,8 @@ class RelayAgentInformation(StrOption):
     Relay Agent Information
     """
 
+    __slots__ = ()
+
     code = 82
     key = "relay_agent_info"
 
@@ -1796,13 +2107,148 @@ class UnknownOption(BinOption):
     Represents any options not defined here.
     """
 
+    # No __slots__ here: unknown options carry per-instance code/key/name/
+    # description, and slot descriptors for those names would shadow the
+    # class-level attributes that from_value relies on
+
+    # name/description/key per code never change, so build them all once
+    # instead of re-deriving the key string on every instantiation
+    _NAMES = {code: meta.get("name", "Unknown") for code, meta in OPTIONS.items()}
+    _DESCRIPTIONS = {
+        code: meta.get("description", "Unknown") for code, meta in OPTIONS.items()
+    }
+    # Keys are derived lazily but at most once per code; interning them
+    # lets downstream dict lookups hit the identity fast path, same as
+    # the literal keys on known options
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _key_for_code(code: int) -> str:
+        name = UnknownOption._NAMES.get(code, "Unknown")
+        return sys.intern("".join(name.split()) + f"_{code}")
+
     def __init__(self, code, length, data):
         self.code = code
-        self.key = (
-            "".join(OPTIONS.get(code, {}).get("name", "Unknown").split()) + f"_{code}"
-        )
+        self.name = self._NAMES.get(code, "Unknown")
+        self.description = self._DESCRIPTIONS.get(code, "Unknown")
+        self.key = self._key_for_code(code)
         super().__init__(code, length, data)
 
 
+def _parse_one(buf, pos: int, out: dict) -> int:
+    """
+    Decodes a single option at pos through the class registry, merges its
+    value into out and returns the position of the next option.
+    """
+    code = buf[pos]
+    if code in (0, 255):
+        out.update((_PAD_SINGLETON if code == 0 else _END_SINGLETON).value)
+        return pos + 1
+    length = buf[pos + 1]
+    end = pos + 2 + length
+    out.update(_code_to_class(code)(code, length, bytes(buf[pos + 2 : end])).value)
+    return end
+
+
+def fast_parse(buf, pos: int = 0) -> dict:
+    """
+    Decodes an options buffer straight into a value dict.
+
+    The handful of options present in nearly every real packet (message
+    type, subnet mask, routers, DNS servers, lease time, server id,
+    T1/T2) are decoded inline without constructing their Option classes;
+    everything else goes through the registry via _parse_one. Produces
+    the same dict as OptionList.as_dict over the parsed options.
+    """
+    out: dict = {}
+    n = len(buf)
+    while pos < n:
+        code = buf[pos]
+        if code == 53:
+            out[MessageType.key] = MessageType._DECODE[buf[pos + 2]]
+            pos += 3
+        elif code == 1:
+            out[SubnetMask.key] = socket.inet_ntoa(buf[pos + 2 : pos + 6])
+            pos += 6
+        elif code == 54:
+            out[ServerIdentifier.key] = socket.inet_ntoa(buf[pos + 2 : pos + 6])
+            pos += 6
+        elif code == 51:
+            out[IPAddressLeaseTime.key] = _U32(buf[pos + 2 : pos + 6])[0]
+            pos += 6
+        elif code == 58:
+            out[RenewalTime.key] = _U32(buf[pos + 2 : pos + 6])[0]
+            pos += 6
+        elif code == 59:
+            out[RebindingTime.key] = _U32(buf[pos + 2 : pos + 6])[0]
+            pos += 6
+        elif code == 3 or code == 6:
+            end = pos + 2 + buf[pos + 1]
+            ips = [socket.inet_ntoa(buf[i : i + 4]) for i in range(pos + 2, end, 4)]
+            out[Router.key if code == 3 else DNSServer.key] = ips
+            pos = end
+        else:
+            pos = _parse_one(buf, pos, out)
+    return out
+
+
+class ParsedOptions:
+    """
+    Structure-of-arrays index over the options region of a packet buffer.
+
+    Only the option codes plus payload offsets and lengths are recorded,
+    in parallel arrays that reference the original buffer; no Option
+    objects are built up front. get() materializes the class for a single
+    code on demand, which suits callers that scan many packets but look
+    at one or two options each (e.g. checking the message type before
+    deciding whether to decode the rest).
+    """
+
+    __slots__ = ("buf", "codes", "offs", "lens")
+
+    def __init__(self, buf, pos: int = 0):
+        self.buf = buf
+        self.codes = codes = array.array("B")
+        self.offs = offs = array.array("H")
+        self.lens = lens = array.array("H")
+        n = len(buf)
+        while pos < n:
+            code = buf[pos]
+            codes.append(code)
+            if code in (0, 255):
+                offs.append(pos + 1)
+                lens.append(0)
+                pos += 1
+            else:
+                length = buf[pos + 1]
+                offs.append(pos + 2)
+                lens.append(length)
+                pos += 2 + length
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code: int) -> bool:
+        return code in self.codes
+
+    def get(self, code: int) -> Optional[Option]:
+        # A packet rarely carries more than ~20 options; scanning the
+        # byte array is cheaper than building a dict nobody may use
+        for i, c in enumerate(self.codes):
+            if c == code:
+                off, length = self.offs[i], self.lens[i]
+                return _code_to_class(code)(
+                    code, length, bytes(self.buf[off : off + length])
+                )
+        return None
+
+
 # this should come after the last option is defined
 options = OptionDirectory()
+
+# Flat module-level aliases for the directory's converters; callers can
+# reach them as options.bytes_to_object(...) etc. without the extra
+# attribute hop through the OptionDirectory instance
+bytes_to_object = options.bytes_to_object
+value_to_bytes = options.value_to_bytes
+value_to_object = options.value_to_object
+short_value_to_object = options.short_value_to_object
@@ -1,3 +1,4 @@
+import functools
 import struct
 import ipaddress
 import random
@@ -9,6 +10,32 @@ from .exceptions import MalformedPacketError, DHCPValueError
 
 OPTIONS_INTERFACE = options.options
 
+# The fixed 236 byte header layout, compiled once; pack_into/unpack_from
+# avoid both the per-call format parse and the header slice copy
+HEADER_STRUCT = struct.Struct("!BBBBLHHLLLL16s64s128s")
+
+# IPv4Address is immutable, so the all-zeros address every convenience
+# constructor needs can be shared instead of rebuilt per packet
+_IP_ZERO = ipaddress.IPv4Address(0)
+
+# String forms the convenience constructors always use; naming them once
+# skips the htype_map round trip per packet build
+_OP_BOOTREQUEST = "BOOTREQUEST"
+_OP_BOOTREPLY = "BOOTREPLY"
+_HTYPE_ETHERNET = "ETHERNET"
+
+
+@functools.lru_cache(maxsize=32)
+def _msg_type_option(msg_type: str):
+    # Options are immutable once built, so the four message-type objects
+    # the convenience constructors insert can be shared across packets
+    return OPTIONS_INTERFACE.short_value_to_object(53, msg_type)
+
+
+def _check_mac(mac_addr: str) -> None:
+    if not utils.is_mac_addr(mac_addr):
+        raise DHCPValueError("MAC address must consist of 6 octets delimited by ':'")
+
 
 @dataclass
 class DHCPPacket(object):
@@ -47,6 +74,26 @@ class DHCPPacket(object):
     +---------------------------------------------------------------+
     """
 
+    # Declared by hand rather than via dataclass(slots=True) to keep
+    # Python 3.8/3.9 support; drops the per-instance __dict__
+    __slots__ = (
+        "op",
+        "htype",
+        "hlen",
+        "hops",
+        "xid",
+        "secs",
+        "flags",
+        "ciaddr",
+        "yiaddr",
+        "siaddr",
+        "giaddr",
+        "chaddr",
+        "sname",
+        "file",
+        "options",
+    )
+
     op: str  # 1 octet - Message Type: 1 is a BOOTREQUEST, 2 is a BOOTREPLY
     htype: str  # 1 octet - Hardware Type: 1 for 10mb ethernet
     hlen: int  # 1 octet - Hardware Address Length: 6 for 10mb ethernet
@@ -54,10 +101,10 @@ class DHCPPacket(object):
     xid: int  # 4 octets - Transaction ID: random number, maintained for entire tx
     secs: int  # 2 octets - Seconds: number of seconds since addr process began
     flags: int  # 2 octets - Flags: bits 1-15 reserved, bit 0 indicates whether to use broadcast
-    ciaddr: ipaddress.IPv4Address  # 4 octets - Client Address: filled in if client can respond to ARP
-    yiaddr: ipaddress.IPv4Address  # 4 octets - 'your' (client) IP address
-    siaddr: ipaddress.IPv4Address  # 4 octets - Next Server: IP of next server to use for bootstrap (OFFER/ACK)
-    giaddr: ipaddress.IPv4Address  # 4 octets - Relay Agent: relay IP
+    ciaddr: Union[int, ipaddress.IPv4Address]  # 4 octets - Client Address: filled in if client can respond to ARP
+    yiaddr: Union[int, ipaddress.IPv4Address]  # 4 octets - 'your' (client) IP address
+    siaddr: Union[int, ipaddress.IPv4Address]  # 4 octets - Next Server: IP of next server to use for bootstrap (OFFER/ACK)
+    giaddr: Union[int, ipaddress.IPv4Address]  # 4 octets - Relay Agent: relay IP
     chaddr: str  # 16 octets - Client Hardware Addr: MAC addr of client (usually len 6 + 10 padding)
     sname: bytes  # 64 octets - Server Name: optional, host name, null terminated
     file: bytes  # 128 octets - File Name: Null terminated str, boot file name
@@ -82,9 +129,33 @@ class DHCPPacket(object):
 
     inverse_htype_map: ClassVar[Dict[str, int]] = {v: k for k, v in htype_map.items()}
 
+    def __post_init__(self):
+        # The four addresses are held as plain ints so serializing needs
+        # no int() unwrap and parsing builds no IPv4Address objects;
+        # IPv4Address (or dotted-quad string) arguments still work
+        self.ciaddr = self.ciaddr if isinstance(self.ciaddr, int) else int(ipaddress.IPv4Address(self.ciaddr))
+        self.yiaddr = self.yiaddr if isinstance(self.yiaddr, int) else int(ipaddress.IPv4Address(self.yiaddr))
+        self.siaddr = self.siaddr if isinstance(self.siaddr, int) else int(ipaddress.IPv4Address(self.siaddr))
+        self.giaddr = self.giaddr if isinstance(self.giaddr, int) else int(ipaddress.IPv4Address(self.giaddr))
+
+    @property
+    def ciaddr_ip(self) -> ipaddress.IPv4Address:
+        return ipaddress.IPv4Address(self.ciaddr)
+
+    @property
+    def yiaddr_ip(self) -> ipaddress.IPv4Address:
+        return ipaddress.IPv4Address(self.yiaddr)
+
+    @property
+    def siaddr_ip(self) -> ipaddress.IPv4Address:
+        return ipaddress.IPv4Address(self.siaddr)
+
+    @property
+    def giaddr_ip(self) -> ipaddress.IPv4Address:
+        return ipaddress.IPv4Address(self.giaddr)
+
     @property
     def asbytes(self):
-        str2bin = lambda s: bytes([int(i, 16) for i in s.split(":")])
         packet_head = [
             self.inverse_op_map[self.op.upper()],
             self.inverse_htype_map[self.htype.upper()],
@@ -93,21 +164,28 @@ class DHCPPacket(object):
             self.xid,
             self.secs,
             self.flags,
+            # int() keeps post-construction IPv4Address assignments
+            # working and is a no-op on the ints __post_init__ stores
             int(self.ciaddr),
             int(self.yiaddr),
             int(self.siaddr),
             int(self.giaddr),
-            str2bin(self.chaddr).ljust(16, b"\x00"),
+            bytes.fromhex(self.chaddr.replace(":", "")).ljust(16, b"\x00"),
             self.sname.ljust(64, b"\x00"),
             self.file.ljust(128, b"\x00"),
         ]
-        encoded_packet = struct.pack(self.packet_fmt, *packet_head)
-        encoded_packet += self.magic_cookie
+        # bytearray grows in place, so appending N options is one buffer
+        # instead of N intermediate bytes objects
+        encoded_packet = bytearray(self.cookie_offset_end)
+        HEADER_STRUCT.pack_into(encoded_packet, 0, *packet_head)
+        encoded_packet[
+            self.cookie_offset_start : self.cookie_offset_end
+        ] = self.magic_cookie
         for option in self.options:
-            encoded_packet += option.asbytes
+            option.write_to(encoded_packet)
         if encoded_packet[-1] != 255:
-            encoded_packet += b"\xff"
-        return encoded_packet
+            encoded_packet.append(255)
+        return bytes(encoded_packet)
 
     @property
     def msg_type(self) -> Optional[str]:
@@ -126,42 +204,49 @@ class DHCPPacket(object):
         try:
             decoded_packet = [
                 field.rstrip(b"\x00") if isinstance(field, bytes) else field
-                for field in struct.unpack(
-                    cls.packet_fmt, packet[: cls.cookie_offset_start]
-                )
+                for field in HEADER_STRUCT.unpack_from(packet, 0)
             ]
         except:
             raise MalformedPacketError("Unable to parse DHCP packet")
 
         options_list = options.OptionList()
+        # memoryview slices are zero-copy, so each option only allocates
+        # once (inside bytes_to_object) instead of per wire-format slice;
+        # hot names are bound locally to keep the scan loop tight
+        packet_view = memoryview(packet)
+        append_option = options_list.append
+        bytes_to_object = OPTIONS_INTERFACE.bytes_to_object
+        end = len(packet)
         read_pos = cls.cookie_offset_end
-        code = 0
-        while read_pos < len(packet) and code != 255:
-            code = packet[read_pos]
-            if code in [0, 255]:
-                data_read_size = 1
-            else:
-                length = packet[read_pos + 1]
-                data_read_size = 1 + 1 + length
+        # Options are decoded eagerly, so a truncated or garbage payload
+        # surfaces here rather than on a later .value access; keep the
+        # failure mode uniform with the header parse above
+        try:
+            while read_pos < end:
+                code = packet[read_pos]
+                if code == 0 or code == 255:
+                    data_read_size = 1
+                else:
+                    data_read_size = 2 + packet[read_pos + 1]
 
-            option_bytes = packet[read_pos : read_pos + data_read_size]
-            options_object = OPTIONS_INTERFACE.bytes_to_object(option_bytes)
-            options_list.append(options_object)
-            read_pos += data_read_size
+                append_option(
+                    bytes_to_object(packet_view[read_pos : read_pos + data_read_size])
+                )
+                if code == 255:
+                    break
+                read_pos += data_read_size
+        except:
+            raise MalformedPacketError("Unable to parse DHCP options")
 
         decoded_packet.append(options_list)
         # Decode the op code
         decoded_packet[0] = cls.op_map[decoded_packet[0]]
         # Decode hardware type
         decoded_packet[1] = cls.htype_map[decoded_packet[1]]
-        # Convert the ciaddr, yiaddr, siaddr, and giaddr into python IP objects
-        decoded_packet[7:11] = [
-            ipaddress.IPv4Address(field) for field in decoded_packet[7:11]
-        ]
+        # ciaddr, yiaddr, siaddr and giaddr stay as the unpacked ints;
+        # the *_ip properties expose them as IPv4Address on demand
         # Convert MAC addr into bin string
-        decoded_packet[11] = decoded_packet[11].ljust(6, b"\x00")
-        bin2str = lambda b: ":".join([f"{i:02X}" for i in b])
-        decoded_packet[11] = bin2str(decoded_packet[11])
+        decoded_packet[11] = decoded_packet[11].ljust(6, b"\x00").hex(":").upper()
         return cls(*decoded_packet)
 
     def format_options(self, opt_str, line_divider, line_len):
@@ -170,7 +255,9 @@ class DHCPPacket(object):
         the string into an ASCII table format.
         """
         line_pos = 0
-        output = ""
+        # accumulate into a list; += on a str inside the loop would
+        # re-copy the whole output once per character
+        parts = []
         new_line = "|\n" + line_divider + "|"
         skip_next_space = False  # Need this for alignment
         last_char = ""
@@ -179,13 +266,50 @@ class DHCPPacket(object):
                 skip_next_space = False
                 continue
             char = " " if last_char == "|" and char == "|" else char
-            output += char
+            parts.append(char)
             line_pos = (line_pos + 1) % line_len
             if line_pos == 0:
-                output += new_line
+                parts.append(new_line)
+                last_char = "|"
                 skip_next_space = True
-            last_char = output[-1]
-        return output
+            else:
+                last_char = char
+        return "".join(parts)
+
+    # Static scaffolding for view_packet, built once at class construction;
+    # only the cell contents are formatted per call.
+    _VIEW_TEMPLATE = (
+        "0                   1                   2                   3    \n"
+        "0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1  \n"
+        "+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+\n"
+        "|{op}|{htype}|{hlen}|{hops}|\n"
+        "+---------------+---------------+---------------+---------------+\n"
+        "|{xid}|\n"
+        "+-------------------------------+-------------------------------+\n"
+        "|{secs}|{flags}|\n"
+        "+-------------------------------+-------------------------------+\n"
+        "|{ciaddr}|\n"
+        "+---------------------------------------------------------------+\n"
+        "|{yiaddr}|\n"
+        "+---------------------------------------------------------------+\n"
+        "|{siaddr}|\n"
+        "+---------------------------------------------------------------+\n"
+        "|{giaddr}|\n"
+        "+---------------------------------------------------------------+\n"
+        "|                                                               |\n"
+        "|{chaddr}|\n"
+        "|                                                               |\n"
+        "|                                                               |\n"
+        "+---------------------------------------------------------------+\n"
+        "|                                                               |\n"
+        "|{sname}|\n"
+        "+---------------------------------------------------------------+\n"
+        "|                                                               |\n"
+        "|{file}|\n"
+        "+---------------------------------------------------------------+\n"
+        "|{cookie}|\n"
+        "+---------------------------------------------------------------+\n"
+    )
 
     def view_packet(self):
         """
@@ -198,51 +322,28 @@ class DHCPPacket(object):
             lambda str_to_space, num_bytes: f"{str_to_space[:spacing(num_bytes)].center(spacing(num_bytes))}|"
         )
         line = "+" + ("-" * (byte_len * bytes_per_line + bytes_per_line))[:-1] + "+\n"
-        base_packet = (
-            "0                   1                   2                   3    \n"
-            "0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1  \n"
-            "+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+\n"
-            "|"
-            + column(f"{self.op} (1)", 1)
-            + column(f"{self.htype} (1)", 1)
-            + column(f"len {self.hlen} (1)", 1)
-            + column(f"{self.hops} hops (1)", 1)
-            + "\n"
-            "+---------------+---------------+---------------+---------------+\n"
-            "|" + column(f"xid=0x{self.xid:08X} (4)", 4) + "\n"
-            "+-------------------------------+-------------------------------+\n"
-            "|"
-            + f"{self.secs} secs (2)".center(spacing(2))
-            + "|"
-            + f"{'BROADCAST' if self.flags else 'UNICAST'} (2)".center(spacing(2))
-            + "|\n"
-            "+-------------------------------+-------------------------------+\n"
-            "|" + column(f"client addr: {self.ciaddr!s} (4)", 4) + "\n"
-            "+---------------------------------------------------------------+\n"
-            "|" + column(f"your addr: {self.yiaddr!s} (4)", 4) + "\n"
-            "+---------------------------------------------------------------+\n"
-            "|" + column(f"next server: {self.siaddr!s} (4)", 4) + "\n"
-            "+---------------------------------------------------------------+\n"
-            "|" + column(f"relay: {self.giaddr!s} (4)", 4) + "\n"
-            "+---------------------------------------------------------------+\n"
-            "|                                                               |\n"
-            "|" + column(f"client mac: {self.chaddr}  (16)", 4) + "\n"
-            "|                                                               |\n"
-            "|                                                               |\n"
-            "+---------------------------------------------------------------+\n"
-            "|                                                               |\n"
-            "|" + column(f"server name: {self.sname}   (64)", 4) + "\n"
-            "+---------------------------------------------------------------+\n"
-            "|                                                               |\n"
-            "|" + column(f"boot file: {self.file} (128)", 4) + "\n"
-            "+---------------------------------------------------------------+\n"
-            "|"
-            + column(
+        cell = lambda str_to_space, num_bytes: str_to_space[
+            : spacing(num_bytes)
+        ].center(spacing(num_bytes))
+        base_packet = self._VIEW_TEMPLATE.format(
+            op=cell(f"{self.op} (1)", 1),
+            htype=cell(f"{self.htype} (1)", 1),
+            hlen=cell(f"len {self.hlen} (1)", 1),
+            hops=cell(f"{self.hops} hops (1)", 1),
+            xid=cell(f"xid=0x{self.xid:08X} (4)", 4),
+            secs=f"{self.secs} secs (2)".center(spacing(2)),
+            flags=f"{'BROADCAST' if self.flags else 'UNICAST'} (2)".center(spacing(2)),
+            ciaddr=cell(f"client addr: {self.ciaddr_ip!s} (4)", 4),
+            yiaddr=cell(f"your addr: {self.yiaddr_ip!s} (4)", 4),
+            siaddr=cell(f"next server: {self.siaddr_ip!s} (4)", 4),
+            giaddr=cell(f"relay: {self.giaddr_ip!s} (4)", 4),
+            chaddr=cell(f"client mac: {self.chaddr}  (16)", 4),
+            sname=cell(f"server name: {self.sname}   (64)", 4),
+            file=cell(f"boot file: {self.file} (128)", 4),
+            cookie=cell(
                 f"magic cookie: {hex(int.from_bytes(self.magic_cookie, 'big'))}",
                 len(self.magic_cookie),
-            )
-            + "\n"
-            "+---------------------------------------------------------------+\n"
+            ),
         )
 
         base_packet += "|"
@@ -263,7 +364,7 @@ class DHCPPacket(object):
 
         base_packet += self.format_options(opt_str, line, spacing(bytes_per_line))
 
-        base_packet += "\n" + line[: len(base_packet.split("\n")[-1])]
+        base_packet += "\n" + line[: len(base_packet) - base_packet.rfind("\n") - 1]
         base_packet = base_packet[:-1] + "+"
         return base_packet
 
@@ -280,24 +381,21 @@ class DHCPPacket(object):
         """
         Convenient constructor for a DHCP discover packet.
         """
-        if not utils.is_mac_addr(mac_addr):
-            raise DHCPValueError(
-                "MAC address must consist of 6 octets delimited by ':'"
-            )
+        _check_mac(mac_addr)
         option_list = option_list if option_list else options.OptionList()
-        option_list.insert(0, options.options.short_value_to_object(53, "DHCPDISCOVER"))
-        relay_ip = ipaddress.IPv4Address(relay or 0)
+        option_list.insert(0, _msg_type_option("DHCPDISCOVER"))
+        relay_ip = ipaddress.IPv4Address(relay) if relay else _IP_ZERO
         return cls(
-            "BOOTREQUEST",
-            cls.htype_map[1],  # 10 mb ethernet
+            _OP_BOOTREQUEST,
+            _HTYPE_ETHERNET,  # htype 1, 10 mb ethernet
             6,  # 6 byte hardware addr
             0,  # clients should set this to 0
             tx_id or random.getrandbits(32),
             seconds,
             0b1000_0000_0000_0000 if use_broadcast else 0,
-            ipaddress.IPv4Address(0),  # Must be 0
-            ipaddress.IPv4Address(0),
-            ipaddress.IPv4Address(0),
+            _IP_ZERO,  # Must be 0
+            _IP_ZERO,
+            _IP_ZERO,
             relay_ip,
             mac_addr,
             b"",
@@ -321,25 +419,22 @@ class DHCPPacket(object):
         """
         Convenient constructor for a DHCP offer packet.
         """
-        if len(mac_addr.split(":")) != 6 or len(mac_addr) != 17:
-            raise DHCPValueError(
-                "MAC address must consist of 6 octets delimited by ':'"
-            )
+        _check_mac(mac_addr)
         option_list = option_list if option_list else options.OptionList()
-        option_list.insert(0, options.options.short_value_to_object(53, "DHCPOFFER"))
-        relay_ip = ipaddress.IPv4Address(relay or 0)
+        option_list.insert(0, _msg_type_option("DHCPOFFER"))
+        relay_ip = ipaddress.IPv4Address(relay) if relay else _IP_ZERO
         return cls(
-            "BOOTREPLY",
-            cls.htype_map[1],  # 10 mb ethernet
+            _OP_BOOTREPLY,
+            _HTYPE_ETHERNET,  # htype 1, 10 mb ethernet
             6,  # 6 byte hardware addr
             0,  # clients should set this to 0
             tx_id,
             seconds,
             0b1000_0000_0000_0000 if use_broadcast else 0,
-            ipaddress.IPv4Address(0),
+            _IP_ZERO,
             # yiaddr - "your address", address being proposed by server
             ipaddress.IPv4Address(yiaddr),
-            ipaddress.IPv4Address(0),
+            _IP_ZERO,
             relay_ip,
             mac_addr,
             sname,
@@ -357,30 +452,27 @@ class DHCPPacket(object):
         relay: Optional[str] = None,
         sname: bytes = b"",
         fname: bytes = b"",
-        client_ip=ipaddress.IPv4Address(0),
+        client_ip=_IP_ZERO,
         option_list: Optional[options.OptionList] = None,
     ):
         """
         Convenient constructor for a DHCP request packet.
         """
-        if len(mac_addr.split(":")) != 6 or len(mac_addr) != 17:
-            raise DHCPValueError(
-                "MAC address must consist of 6 octets delimited by ':'"
-            )
+        _check_mac(mac_addr)
         option_list = option_list if option_list else options.OptionList()
-        option_list.insert(0, options.options.short_value_to_object(53, "DHCPREQUEST"))
-        relay_ip = ipaddress.IPv4Address(relay or 0)
+        option_list.insert(0, _msg_type_option("DHCPREQUEST"))
+        relay_ip = ipaddress.IPv4Address(relay) if relay else _IP_ZERO
         return cls(
-            "BOOTREQUEST",
-            cls.htype_map[1],  # 10 mb ethernet
+            _OP_BOOTREQUEST,
+            _HTYPE_ETHERNET,  # htype 1, 10 mb ethernet
             6,  # 6 byte hardware addr
             0,  # clients should set this to 0
             tx_id,
             seconds,
             0b1000_0000_0000_0000 if use_broadcast else 0,
             client_ip,
-            ipaddress.IPv4Address(0),
-            ipaddress.IPv4Address(0),
+            _IP_ZERO,
+            _IP_ZERO,
             relay_ip,
             mac_addr,
             sname,
@@ -405,25 +497,22 @@ class DHCPPacket(object):
         Convenient constructor for a DHCP ack packet.
         """
         # Can be refactored to just use the Request constructor if it turns out that Ack has no special needs.
-        if len(mac_addr.split(":")) != 6 or len(mac_addr) != 17:
-            raise DHCPValueError(
-                "MAC address must consist of 6 octets delimited by ':'"
-            )
+        _check_mac(mac_addr)
         option_list = option_list if option_list else options.OptionList()
-        option_list.insert(0, options.options.short_value_to_object(53, "DHCPACK"))
-        relay_ip = ipaddress.IPv4Address(relay or 0)
+        option_list.insert(0, _msg_type_option("DHCPACK"))
+        relay_ip = ipaddress.IPv4Address(relay) if relay else _IP_ZERO
         return cls(
-            "BOOTREPLY",
-            cls.htype_map[1],  # 10 mb ethernet
+            _OP_BOOTREPLY,
+            _HTYPE_ETHERNET,  # htype 1, 10 mb ethernet
             6,  # 6 byte hardware addr
             0,  # clients should set this to 0
             tx_id,
             seconds,
             0b1000_0000_0000_0000 if use_broadcast else 0,
-            ipaddress.IPv4Address(0),
+            _IP_ZERO,
             # yiaddr - "your address", address being proposed by server
             ipaddress.IPv4Address(yiaddr),
-            ipaddress.IPv4Address(0),
+            _IP_ZERO,
             relay_ip,
             mac_addr,
             sname,
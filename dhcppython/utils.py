@@ -1,6 +1,10 @@
+import functools
+import os
 import random
+import re
 import string
 import datetime
+import time
 import socket
 import unicodedata
 from typing import Dict
@@ -11,13 +15,28 @@ from . import runtime_assets
 VALID_HEX = list(set(string.hexdigits.upper()))
 
 
+_DATETIME_FMT = "%Y-%m-%dT%H:%M:%SZ"
+_DATETIME_FMT_US = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
 def cur_datetime(us_precision: bool = False) -> str:
-    fmt = "%Y-%m-%dT%H:%M:%S" + (".%f" if us_precision else "") + "Z"
+    fmt = _DATETIME_FMT_US if us_precision else _DATETIME_FMT
     return datetime.datetime.now(datetime.timezone.utc).strftime(fmt)
 
 
 def cur_timestamp() -> int:
-    return int(datetime.datetime.utcnow().timestamp() * 10 ** 9)
+    return time.time_ns()
+
+
+# See https://www.unicode.org/reports/tr11/ for how this dict in constructed
+_VISUAL_LEN = {
+    "F": 1,
+    "H": 1,
+    "Na": 1,
+    "N": 1,
+    "W": 2,
+    "A": 2,
+}
 
 
 def visual_length(text: str) -> int:
@@ -25,16 +44,8 @@ def visual_length(text: str) -> int:
     Given a string it returns the visual length of the string as opposed to the
     len function which returns the number of printable characters.
     """
-    # See https://www.unicode.org/reports/tr11/ for how this dict in constructed
-    visual_len = {
-        "F": 1,
-        "H": 1,
-        "Na": 1,
-        "N": 1,
-        "W": 2,
-        "A": 2,
-    }
-    return sum([visual_len[unicodedata.east_asian_width(char)] for char in text]) + 1
+    eaw = unicodedata.east_asian_width
+    return sum(_VISUAL_LEN[eaw(char)] for char in text) + 1
 
 
 def random_mac(num_bytes: int = 6, delimiter: str = ":") -> str:
@@ -44,9 +55,14 @@ def random_mac(num_bytes: int = 6, delimiter: str = ":") -> str:
     >>> random_mac()
     'CC:AC:3C:85:A4:EF'
     """
-    return delimiter.join(
-        ["".join(random.choices(VALID_HEX, k=2)) for i in range(num_bytes)]
-    )
+    raw = os.urandom(num_bytes)
+    return (raw.hex(delimiter) if delimiter else raw.hex()).upper()
+
+
+# Six hex octets joined by a consistent ":" or "-" delimiter
+_MAC_RE = re.compile(
+    r"[0-9A-Fa-f]{2}(?P<sep>[:-])(?:[0-9A-Fa-f]{2}(?P=sep)){4}[0-9A-Fa-f]{2}\Z"
+)
 
 
 def is_mac_addr(mac_addr: str) -> bool:
@@ -55,46 +71,59 @@ def is_mac_addr(mac_addr: str) -> bool:
 
     Accepts ":" or "-" as valid MAC address delimiters.
     """
-    mac_addr = mac_addr.upper()
-    delimiter = ":" if ":" in mac_addr else "-"
-    if len(mac_addr.split(delimiter)) != 6 or len(mac_addr) != 17:
-        return False
-    if any([b not in VALID_HEX for b in "".join(mac_addr.split(delimiter))]):
-        return False
-    return True
-
-
-mac_vendor_map: Dict[str, str] = {
-    line.split("\t\t")[0].split(" ")[0]: line.split("\t\t")[1]
-    for line in [
-        line.strip()
-        for line in importlib.resources.read_text(runtime_assets, "oui.txt").split("\n")
-        if "(base 16)" in line
-    ]
-}
+    return _MAC_RE.match(mac_addr) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_mac_vendor_map() -> Dict[str, str]:
+    """
+    Parses the bundled IEEE OUI registry into an OUI -> vendor dict.
+
+    Deferred to first use so importing the package does not pay for
+    reading and splitting the ~30k line oui.txt file.
+    """
+    out: Dict[str, str] = {}
+    for line in importlib.resources.read_text(runtime_assets, "oui.txt").split("\n"):
+        if "(base 16)" in line:
+            left, right = line.split("\t\t", 1)
+            out[left.split(" ", 1)[0]] = right.strip()
+    return out
+
+
+def __getattr__(name: str):
+    # mac_vendor_map used to be built eagerly at import; keep the name
+    # working for anyone who reads it off the module directly
+    if name == "mac_vendor_map":
+        return _load_mac_vendor_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=8192)
+def _oui2vendor(oui: str) -> str:
+    return _load_mac_vendor_map().get(oui, "Unknown Manufacturer")
 
 
 def mac2vendor(mac_addr: str) -> str:
+    # Vendor is determined entirely by the 3 byte OUI prefix, so a whole
+    # fleet of the same vendor shares one cache entry. is_mac_addr has
+    # validated the xx:xx:xx... layout, so the octets sit at fixed offsets
     if is_mac_addr(mac_addr):
-        return mac_vendor_map.get(
-            mac_addr.replace(":", "").replace("-", "")[:6].upper(),
-            "Unknown Manufacturer",
-        )
+        return _oui2vendor((mac_addr[0:2] + mac_addr[3:5] + mac_addr[6:8]).upper())
     else:
         raise ValueError(f"{mac_addr} is not a valid MAC address")
 
 
 def get_ip_by_iface(iface: str) -> str:
     rand_port = 61224
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    s.setsockopt(socket.SOL_SOCKET, 25, iface.encode())
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    s.connect(("255.255.255.255", rand_port))
-    return s.getsockname()[0]
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, iface.encode())
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        s.connect(("255.255.255.255", rand_port))
+        return s.getsockname()[0]
 
 
 def get_ip_by_server(server: str) -> str:
     rand_port = 61222
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    s.connect((server, rand_port))
-    return s.getsockname()[0]
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect((server, rand_port))
+        return s.getsockname()[0]
@@ -1,254 +1,227 @@
+import copy
 import unittest
 from dhcppython import options
 
 
-class OptionListTestCases(unittest.TestCase):
-    def gen_optionslist(self):
-        return options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43])
-            ]
-        )
-
-    def test_OptionsList_append1(self):
-        opt_list = self.gen_optionslist()
-        opt_list.append(options.options.short_value_to_object(1, "255.255.255.0"))
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-                options.options.short_value_to_object(1, "255.255.255.0")
-            ]
-            )
-        )
+# The options the assertions compare against are constants of the
+# suite, parsed exactly once at import via the module-level converter
+short_value_to_object = options.short_value_to_object
 
-    def test_OptionsList_append2(self):
-        opt_list = self.gen_optionslist()
-        opt_list.append(options.options.short_value_to_object(57, 2000))
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+OPT_CLIENT_ID = short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"})
+OPT_MAX_MSG_SIZE_1500 = short_value_to_object(57, 1500)
+OPT_MAX_MSG_SIZE_2000 = short_value_to_object(57, 2000)
+OPT_VENDOR_CLASS = short_value_to_object(60, "android-dhcp-9")
+OPT_HOSTNAME = short_value_to_object(12, "Galaxy-S9")
+OPT_PARAM_REQ_LIST = short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43])
+OPT_SUBNET_MASK = short_value_to_object(1, "255.255.255.0")
+OPT_TIME_OFFSET = short_value_to_object(2, 3600)
 
-    def test_OptionList_update_by_index1(self):
-        opt_list = self.gen_optionslist()
-        opt_list[1] = options.options.short_value_to_object(57, 2000)
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+BASELINE_OPTIONS = [
+    OPT_CLIENT_ID,
+    OPT_MAX_MSG_SIZE_1500,
+    OPT_VENDOR_CLASS,
+    OPT_HOSTNAME,
+    OPT_PARAM_REQ_LIST,
+]
 
-    def test_OptionList_update_by_index2(self):
-        opt_list = self.gen_optionslist()
-        opt_list[0] = options.options.short_value_to_object(57, 2000)
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
 
-    def test_OptionList_update_by_index3(self):
-        opt_list = self.gen_optionslist()
-        opt_list[3] = options.options.short_value_to_object(57, 2000)
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
-    
-    def test_OptionList_insert1(self):
-        opt_list = self.gen_optionslist()
-        opt_list.insert(1, options.options.short_value_to_object(57, 2000))
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+class OptionListTestCases(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Parsing the five baseline options is identical for every test,
+        # so do it once and hand each test a deep copy to mutate
+        cls.baseline_optionlist = options.OptionList(BASELINE_OPTIONS)
 
-    def test_OptionList_insert2(self):
-        opt_list = self.gen_optionslist()
-        opt_list.insert(0, options.options.short_value_to_object(57, 2000))
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+    def gen_optionslist(self):
+        return copy.deepcopy(self.baseline_optionlist)
 
-    def test_OptionList_insert3(self):
-        opt_list = self.gen_optionslist()
-        opt_list.insert(3, options.options.short_value_to_object(57, 2000))
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(57, 2000),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+    # Read-only tests (len, contains, as_dict, json) take the shared
+    # baseline directly and must not mutate it; anything that mutates
+    # goes through gen_optionslist for a private copy
 
-    def test_OptionList_insert4(self):
+    def test_OptionsList_append1(self):
         opt_list = self.gen_optionslist()
-        opt_list.insert(0, options.options.short_value_to_object(1, "255.255.255.0"))
+        opt_list.append(OPT_SUBNET_MASK)
         self.assertEqual(
             opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(1, "255.255.255.0"),
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
+            BASELINE_OPTIONS + [OPT_SUBNET_MASK]
         )
 
-    def test_OptionList_insert5(self):
-        opt_list = self.gen_optionslist()
-        opt_list.insert(-1, options.options.short_value_to_object(1, "255.255.255.0"))
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(1, "255.255.255.0"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
-
-    def test_OptionList_insert6(self):
+    def test_OptionsList_append2(self):
         opt_list = self.gen_optionslist()
-        opt_list.insert(5, options.options.short_value_to_object(1, "255.255.255.0"))
+        opt_list.append(OPT_MAX_MSG_SIZE_2000)
         self.assertEqual(
             opt_list,
-            options.OptionList(
             [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-                options.options.short_value_to_object(1, "255.255.255.0"),
+                OPT_CLIENT_ID,
+                OPT_MAX_MSG_SIZE_2000,
+                OPT_VENDOR_CLASS,
+                OPT_HOSTNAME,
+                OPT_PARAM_REQ_LIST,
             ]
-            )
         )
 
-    def test_OptionList_del1(self):
-        opt_list = self.gen_optionslist()
-        del opt_list[0]
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+    def test_OptionList_update_by_index(self):
+        cases = [
+            (
+                "update_by_index1",
+                1,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_MAX_MSG_SIZE_2000,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "update_by_index2",
+                0,
+                [
+                    OPT_MAX_MSG_SIZE_2000,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "update_by_index3",
+                3,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_VENDOR_CLASS,
+                    OPT_MAX_MSG_SIZE_2000,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+        ]
+        for case_id, index, expected in cases:
+            with self.subTest(case=case_id, index=index):
+                opt_list = self.gen_optionslist()
+                opt_list[index] = OPT_MAX_MSG_SIZE_2000
+                self.assertEqual(opt_list, expected)
 
-    def test_OptionList_del2(self):
-        opt_list = self.gen_optionslist()
-        del opt_list[-1]
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(60, "android-dhcp-9"),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-            ]
-            )
-        )
+    def test_OptionList_insert(self):
+        cases = [
+            (
+                "insert1",
+                1,
+                OPT_MAX_MSG_SIZE_2000,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_MAX_MSG_SIZE_2000,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "insert2",
+                0,
+                OPT_MAX_MSG_SIZE_2000,
+                [
+                    OPT_MAX_MSG_SIZE_2000,
+                    OPT_CLIENT_ID,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "insert3",
+                3,
+                OPT_MAX_MSG_SIZE_2000,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_MAX_MSG_SIZE_2000,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "insert4",
+                0,
+                OPT_SUBNET_MASK,
+                [OPT_SUBNET_MASK] + BASELINE_OPTIONS,
+            ),
+            (
+                "insert5",
+                -1,
+                OPT_SUBNET_MASK,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_MAX_MSG_SIZE_1500,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_SUBNET_MASK,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "insert6",
+                5,
+                OPT_SUBNET_MASK,
+                BASELINE_OPTIONS + [OPT_SUBNET_MASK],
+            ),
+        ]
+        for case_id, index, option, expected in cases:
+            with self.subTest(case=case_id, index=index, code=option.code):
+                opt_list = self.gen_optionslist()
+                opt_list.insert(index, option)
+                self.assertEqual(opt_list, expected)
 
-    def test_OptionList_del3(self):
-        opt_list = self.gen_optionslist()
-        del opt_list[2]
-        self.assertEqual(
-            opt_list,
-            options.OptionList(
-            [
-                options.options.short_value_to_object(61, {'hwtype': 1, 'hwaddr': "8c:45:00:1d:48:16"}),
-                options.options.short_value_to_object(57, 1500),
-                options.options.short_value_to_object(12, "Galaxy-S9"),
-                options.options.short_value_to_object(55, [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]),
-            ]
-            )
-        )
+    def test_OptionList_del(self):
+        cases = [
+            (
+                "del1",
+                0,
+                [
+                    OPT_MAX_MSG_SIZE_1500,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+            (
+                "del2",
+                -1,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_MAX_MSG_SIZE_1500,
+                    OPT_VENDOR_CLASS,
+                    OPT_HOSTNAME,
+                ],
+            ),
+            (
+                "del3",
+                2,
+                [
+                    OPT_CLIENT_ID,
+                    OPT_MAX_MSG_SIZE_1500,
+                    OPT_HOSTNAME,
+                    OPT_PARAM_REQ_LIST,
+                ],
+            ),
+        ]
+        for case_id, index, expected in cases:
+            with self.subTest(case=case_id, index=index):
+                opt_list = self.gen_optionslist()
+                del opt_list[index]
+                self.assertEqual(opt_list, expected)
 
     def test_OptionList_len1(self):
         self.assertEqual(
-            len(self.gen_optionslist()),
+            len(self.baseline_optionlist),
             5
         )
 
     def test_OptionList_len2(self):
         opt_list = self.gen_optionslist()
-        opt_list.insert(5, options.options.short_value_to_object(1, "255.255.255.0"))
-        opt_list.append(options.options.short_value_to_object(2, 3600))
+        opt_list.insert(5, OPT_SUBNET_MASK)
+        opt_list.append(OPT_TIME_OFFSET)
         del opt_list[5]
-        opt_list.append(options.options.short_value_to_object(1, "255.255.255.0"))
+        opt_list.append(OPT_SUBNET_MASK)
         del opt_list[5]
 
         self.assertEqual(
@@ -258,31 +231,31 @@ class OptionListTestCases(unittest.TestCase):
 
     def test_OptionList_contains1(self):
         self.assertEqual(
-            57 in self.gen_optionslist(),
+            57 in self.baseline_optionlist,
             True
         )
 
     def test_OptionList_contains2(self):
         self.assertEqual(
-            1 in self.gen_optionslist(),
+            1 in self.baseline_optionlist,
             False
         )
 
     def test_OptionList_contains3(self):
         self.assertEqual(
-            options.options.short_value_to_object(57, 1500) in self.gen_optionslist(),
+            OPT_MAX_MSG_SIZE_1500 in self.baseline_optionlist,
             True
         )
 
     def test_OptionList_contains4(self):
         self.assertEqual(
-            options.options.short_value_to_object(2, 3600) in self.gen_optionslist(),
+            OPT_TIME_OFFSET in self.baseline_optionlist,
             False
         )
 
     def test_OptionList_as_dict(self):
         self.assertEqual(
-            self.gen_optionslist().as_dict(),
+            self.baseline_optionlist.as_dict(),
             {'client_identifier': {'hwtype': 1, 'hwaddr': '8C:45:00:1D:48:16'}, 'max_dhcp_message_size': 1500, 'vendor_class_identifier': 'android-dhcp-9', 'hostname': 'Galaxy-S9', 'parameter_request_list': [1, 3, 6, 15, 26, 28, 51, 58, 59, 43]}
         )
 
@@ -297,7 +270,7 @@ class OptionListTestCases(unittest.TestCase):
             '     43\n    ]\n}'
         )
         self.assertEqual(
-            self.gen_optionslist().json,
+            self.baseline_optionlist.json,
             json_expected
         )
 